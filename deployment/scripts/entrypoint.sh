@@ -34,12 +34,16 @@ if [ -n "$TELEGRAM_WEBHOOK_URL" ]; then
   python -c "
 import asyncio
 from telegram import Bot
+from src.bot.updates import ALLOWED_UPDATES
 
 async def set_webhook():
     bot = Bot('$TELEGRAM_BOT_TOKEN')
     webhook_info = await bot.get_webhook_info()
-    if webhook_info.url != '$TELEGRAM_WEBHOOK_URL':
-        await bot.set_webhook(url='$TELEGRAM_WEBHOOK_URL')
+    # Telegram keeps the previous allowed_updates when a call omits them, so
+    # also re-register when only the update filter differs
+    if (webhook_info.url != '$TELEGRAM_WEBHOOK_URL'
+            or set(webhook_info.allowed_updates or ()) != set(ALLOWED_UPDATES)):
+        await bot.set_webhook(url='$TELEGRAM_WEBHOOK_URL', allowed_updates=ALLOWED_UPDATES)
         print(f'Webhook set to: $TELEGRAM_WEBHOOK_URL')
     else:
         print(f'Webhook already set to: {webhook_info.url}')
@@ -10,6 +10,7 @@ Usage:
     python scripts/set_webhook.py --delete     # Delete webhook
     python scripts/set_webhook.py --info       # Show webhook info only
 """
+import json
 import os
 import sys
 import argparse
@@ -27,6 +28,8 @@ django.setup()
 from django.conf import settings
 import requests
 
+from src.bot.updates import ALLOWED_UPDATES
+
 
 def get_webhook_info():
     """Get current webhook information from Telegram.
@@ -127,7 +130,8 @@ def set_webhook(drop_pending_updates=False):
 
     api_url = f"https://api.telegram.org/bot{token}/setWebhook"
 
-    data = {'url': webhook_url}
+    # allowed_updates is a JSON-serialized array in form-encoded requests
+    data = {'url': webhook_url, 'allowed_updates': json.dumps(ALLOWED_UPDATES)}
     if drop_pending_updates:
         data['drop_pending_updates'] = True
 
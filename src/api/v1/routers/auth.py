@@ -327,27 +327,27 @@ async def _send_auth_code_to_telegram(user: User, code: str, device_info: str |
     try:
         from telegram import Bot
         from src.config import settings
-        from src.bot.messages import Messages
+        from src.bot.messages import MESSAGES_EN
         import html
 
         bot = Bot(token=settings.telegram_bot_token)
 
         # Build message
         message_lines = [
-            Messages.AUTH_CODE_LOGIN_CODE.format(code=code),
+            MESSAGES_EN['AUTH_CODE_LOGIN_CODE'].format(code=code),
             "",
         ]
 
         if device_info:
             message_lines.append(
-                Messages.AUTH_CODE_DEVICE.format(device=html.escape(device_info))
+                MESSAGES_EN['AUTH_CODE_DEVICE'].format(device=html.escape(device_info))
             )
 
         message_lines.extend([
-            Messages.AUTH_CODE_EXPIRES,
+            MESSAGES_EN['AUTH_CODE_EXPIRES'],
             "",
-            Messages.AUTH_CODE_WARNING_1,
-            Messages.AUTH_CODE_WARNING_2,
+            MESSAGES_EN['AUTH_CODE_WARNING_1'],
+            MESSAGES_EN['AUTH_CODE_WARNING_2'],
         ])
 
         message = "\n".join(message_lines)
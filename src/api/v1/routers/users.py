@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field
 
 from src.api.dependencies.auth import get_current_user_flexible
 from src.bot.timezone_utils import validate_timezone
+from src.bot.user_cache import invalidate_user
 from src.core.models import User
 from src.core.repositories import user_repository
 from src.utils.async_compat import maybe_await
@@ -111,6 +112,9 @@ async def update_current_user(
         updated_user = await maybe_await(
             user_repository.update(current_user.id, update_dict)
         )
+        if "language" in update_dict and updated_user.telegram_id:
+            # The bot caches users' language for /start and /help
+            invalidate_user(updated_user.telegram_id)
         logger.info("User %s updated: %s", current_user.id, list(update_dict.keys()))
     else:
         updated_user = current_user
@@ -0,0 +1,28 @@
+"""Single handler that routes plain slash commands by name."""
+
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+from telegram import Update
+from telegram.ext import CommandHandler, ContextTypes
+
+CommandCallback = Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[Any]]
+
+
+class CommandDispatchHandler(CommandHandler):
+    """CommandHandler for several commands, each with its own callback.
+
+    PTB walks a group's handlers in order for every update, so registering one
+    handler for all stateless commands keeps that list short; the callback is
+    then picked with a dict lookup on the command name. Commands that start or
+    continue a conversation stay in their ConversationHandler entry points.
+    """
+
+    def __init__(self, callbacks: Mapping[str, CommandCallback], **kwargs):
+        self.callbacks = {command.lower(): callback for command, callback in callbacks.items()}
+        super().__init__(self.callbacks.keys(), self._dispatch, **kwargs)
+
+    async def _dispatch(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        message = update.effective_message
+        command = message.text[1:message.entities[0].length].split("@", 1)[0]
+        return await self.callbacks[command.lower()](update, context)
@@ -6,9 +6,15 @@ when importing from webhook_handler.py.
 """
 
 import logging
+from functools import wraps
 from telegram import Update
 from telegram.ext import ContextTypes
 
+from src.bot.keyboards import build_back_to_menu_keyboard, build_start_menu_keyboard
+from src.bot.language import detect_language_from_telegram, get_message_language_for_user
+from src.bot.messages import msg
+from src.bot.navigation import clear_navigation, push_navigation
+from src.bot.user_cache import get_user_by_telegram_id
 from src.core.repositories import user_repository as default_user_repository
 from src.utils.async_compat import maybe_await
 
@@ -26,67 +32,88 @@ def _resolve_user_repository():
     return getattr(bot_main, "user_repository", default_user_repository)
 
 
-async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE | None):
-    """Handle /start command."""
-    from src.bot.messages import msg
-    from src.bot.language import detect_language_from_telegram
-    from src.bot.navigation import clear_navigation, push_navigation
-    from src.bot.keyboards import build_start_menu_keyboard
+def require_active_user(command: str):
+    """
+    Load the sending user before running a command handler.
+
+    Replies with ERROR_USER_NOT_FOUND or ERROR_USER_INACTIVE and stops when the
+    user is missing or inactive; otherwise calls the handler with the user.
+
+    Args:
+        command: Command name, used in log messages
+
+    Returns:
+        Decorator turning handler(update, context, user) into a PTB callback
+    """
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE | None):
+            telegram_id = update.effective_user.id
+            username = update.effective_user.username or "N/A"
+            logger.info("📨 Received /%s command from user %s (@%s)", command, telegram_id, username)
+
+            user_repository = _resolve_user_repository()
+
+            # Validate user exists (cached briefly; misses go to the async repository)
+            user = await get_user_by_telegram_id(user_repository, telegram_id)
+            if not user:
+                logger.warning("⚠️ User %s not found in database", telegram_id)
+                await update.message.reply_text(
+                    msg('ERROR_USER_NOT_FOUND', detect_language_from_telegram(update))
+                )
+                logger.info("📤 Sent ERROR_USER_NOT_FOUND message to %s", telegram_id)
+                return
+
+            # Check if user is active
+            if not user.is_active:
+                logger.warning("⚠️ User %s is inactive", telegram_id)
+                await update.message.reply_text(
+                    msg('ERROR_USER_INACTIVE', get_message_language_for_user(user, update))
+                )
+                logger.info("📤 Sent ERROR_USER_INACTIVE message to %s", telegram_id)
+                return
+
+            return await handler(update, context, user)
+
+        return wrapper
+
+    return decorator
+
 
+@require_active_user("start")
+async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE | None, user):
+    """Handle /start command."""
     telegram_id = str(update.effective_user.id)
-    username = update.effective_user.username or "N/A"
-    logger.info(f"📨 Received /start command from user {telegram_id} (@{username})")
 
     # Clear navigation stack on /start (fresh start)
     clear_navigation(context)
 
     user_repository = _resolve_user_repository()
 
-    # Validate user exists (wrap in sync_to_async for Django ORM)
-    user = await maybe_await(user_repository.get_by_telegram_id(telegram_id))
-    if not user:
-        logger.warning(f"⚠️ User {telegram_id} not found in database")
-        lang = detect_language_from_telegram(update) if update else 'en'
-        await update.message.reply_text(
-            msg('ERROR_USER_NOT_FOUND', lang)
-        )
-        logger.info(f"📤 Sent ERROR_USER_NOT_FOUND message to {telegram_id}")
-        return
-
     # Sync Telegram username for web login (always — clears stale values too)
     try:
         await maybe_await(
             user_repository.update_telegram_username(telegram_id, update.effective_user.username)
         )
     except Exception as e:
-        logger.warning(f"Failed to sync telegram username: {e}")
+        logger.warning("Failed to sync telegram username: %s", e)
 
-    # Auto-detect and set language if not already set
-    if not user.language or user.language == 'en':
+    # Auto-detect and set language if not already set; only write when the
+    # detected language differs from the stored one
+    lang = user.language or 'en'
+    if lang == 'en':
         detected_lang = detect_language_from_telegram(update)
-        if detected_lang != 'en' and detected_lang != user.language:
+        if detected_lang != 'en':
             try:
                 await maybe_await(
                     user_repository.update(user.id, {"language": detected_lang})
                 )
-                user.language = detected_lang
-                logger.info(f"Updated language for user {telegram_id} to {detected_lang}")
+                user.language = lang = detected_lang
+                logger.info("Updated language for user %s to %s", telegram_id, detected_lang)
             except Exception as e:
-                logger.warning(f"Failed to update user language: {e}")
-
-    # Get final language for messages
-    lang = user.language if user.language else 'en'
-
-    # Check if user is active
-    if not user.is_active:
-        logger.warning(f"⚠️ User {telegram_id} is inactive")
-        await update.message.reply_text(
-            msg('ERROR_USER_INACTIVE', lang)
-        )
-        logger.info(f"📤 Sent ERROR_USER_INACTIVE message to {telegram_id}")
-        return
+                logger.warning("Failed to update user language: %s", e)
 
-    logger.info(f"✅ Sending start menu to user {telegram_id} in language: {lang}")
+    logger.info("✅ Sending start menu to user %s in language: %s", telegram_id, lang)
 
     # Note: /start command is not logged to audit trail (frequent, low-value event)
 
@@ -98,43 +125,18 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE | Non
 
     # Push initial navigation state
     push_navigation(context, sent_message.message_id, 'start', lang, telegram_id=telegram_id)
-    logger.info(f"📤 Sent START_MENU to {telegram_id}")
+    logger.info("📤 Sent START_MENU to %s", telegram_id)
 
 
-async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE | None):
+@require_active_user("help")
+async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE | None, user):
     """Handle /help command."""
-    from src.bot.messages import msg
-    from src.bot.language import get_message_language_async, detect_language_from_telegram
-    from src.bot.keyboards import build_back_to_menu_keyboard
+    telegram_id = update.effective_user.id
 
-    telegram_id = str(update.effective_user.id)
-    username = update.effective_user.username or "N/A"
-    logger.info(f"📨 Received /help command from user {telegram_id} (@{username})")
-    lang = await get_message_language_async(telegram_id, update)
-
-    user_repository = _resolve_user_repository()
-
-    # Validate user exists (wrap in sync_to_async for Django ORM)
-    user = await maybe_await(user_repository.get_by_telegram_id(telegram_id))
-    if not user:
-        logger.warning(f"⚠️ User {telegram_id} not found in database")
-        fallback_lang = detect_language_from_telegram(update) if update else lang
-        await update.message.reply_text(
-            msg('ERROR_USER_NOT_FOUND', fallback_lang)
-        )
-        logger.info(f"📤 Sent ERROR_USER_NOT_FOUND message to {telegram_id}")
-        return
-
-    # Check if user is active
-    if not user.is_active:
-        logger.warning(f"⚠️ User {telegram_id} is inactive")
-        await update.message.reply_text(
-            msg('ERROR_USER_INACTIVE', lang)
-        )
-        logger.info(f"📤 Sent ERROR_USER_INACTIVE message to {telegram_id}")
-        return
+    # Language comes from the user we just loaded; no second lookup
+    lang = get_message_language_for_user(user, update)
 
-    logger.info(f"✅ Sending help message to user {telegram_id} in language: {lang}")
+    logger.info("✅ Sending help message to user %s in language: %s", telegram_id, lang)
 
     # Note: /help command is not logged to audit trail (frequent, low-value event)
 
@@ -143,4 +145,4 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE | None
         reply_markup=build_back_to_menu_keyboard(lang),
         parse_mode="HTML"
     )
-    logger.info(f"📤 Sent HELP_COMMAND_MESSAGE to {telegram_id}")
+    logger.info("📤 Sent HELP_COMMAND_MESSAGE to %s", telegram_id)
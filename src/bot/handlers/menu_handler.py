@@ -189,7 +189,7 @@ async def bridge_command_callback(update: Update, context: ContextTypes.DEFAULT_
     logger.info(f"🔀 Bridging menu callback '{data}' to command handler for user {telegram_id}")
 
     # Import handlers dynamically
-    from src.bot.main import help_command
+    from src.bot.handlers.command_handlers import help_command
     from src.bot.handlers.streak_handler import streaks_command
     from src.bot.handlers.habit_management_handler import (
         add_habit_command
@@ -953,36 +953,40 @@ async def view_habit_display_callback(update: Update, context: ContextTypes.DEFA
     return 0
 
 
-# Factory to register all menu callbacks in main
+# Menu callbacks registered by main and the webhook handler. Built once at
+# import; the handlers are stateless, so both applications share the instances.
+_MENU_HANDLERS = (
+    CallbackQueryHandler(open_start_menu_callback, pattern="^menu_start$"),
+    CallbackQueryHandler(open_habits_menu_callback, pattern="^menu_habits$"),
+    CallbackQueryHandler(open_rewards_menu_callback, pattern="^menu_rewards$"),
+    CallbackQueryHandler(close_menu_callback, pattern="^menu_close$"),
+    # menu_habits_remove is intentionally excluded here: remove_habit_conversation
+    # handles it in group 0. Bridging it in group 1 also posts command text.
+    CallbackQueryHandler(bridge_command_callback, pattern="^(menu_habit_done|menu_habit_done_date|menu_streaks|menu_help|menu_habits_add|menu_habits_revert|menu_rewards_list|menu_rewards_my|menu_rewards_claimed)$"),
+    CallbackQueryHandler(open_start_menu_callback, pattern="^menu_back_start$"),
+    CallbackQueryHandler(open_habits_menu_callback, pattern="^menu_back_habits$"),
+    CallbackQueryHandler(generic_back_callback, pattern="^menu_back$"),
+    # Settings standalone handlers (work outside conversation)
+    CallbackQueryHandler(settings_language_callback, pattern="^settings_language$"),
+    CallbackQueryHandler(change_language_standalone_callback, pattern="^lang_(en|kk|ru)$"),
+    CallbackQueryHandler(settings_back_callback, pattern="^settings_back$"),
+    # Habit display handler (view only, no action)
+    CallbackQueryHandler(view_habit_display_callback, pattern="^view_habit_"),
+    # Simple habit flow handler (one-click completion for today)
+    # This must come BEFORE habit_selected_standalone_callback
+    CallbackQueryHandler(simple_habit_selected_callback, pattern="^simple_habit_"),
+    # Menu habit_done flow handlers (Today/Yesterday/Select Date buttons)
+    CallbackQueryHandler(menu_habit_today_callback, pattern="^habit_.*_today$"),
+    CallbackQueryHandler(menu_habit_yesterday_callback, pattern="^habit_.*_yesterday$"),
+    CallbackQueryHandler(menu_select_date_callback, pattern="^backdate_habit_"),
+    CallbackQueryHandler(menu_backdate_date_selected_callback, pattern="^backdate_date_"),
+    CallbackQueryHandler(menu_backdate_confirm_callback, pattern="^backdate_confirm_"),
+    CallbackQueryHandler(menu_backdate_cancel_callback, pattern="^backdate_cancel$"),
+    # Habit selection standalone handler (work outside conversation)
+    # This must be LAST to avoid catching other habit_* patterns
+    CallbackQueryHandler(habit_selected_standalone_callback, pattern="^habit_"),
+)
+
+
 def get_menu_handlers():
-    return [
-        CallbackQueryHandler(open_start_menu_callback, pattern="^menu_start$"),
-        CallbackQueryHandler(open_habits_menu_callback, pattern="^menu_habits$"),
-        CallbackQueryHandler(open_rewards_menu_callback, pattern="^menu_rewards$"),
-        CallbackQueryHandler(close_menu_callback, pattern="^menu_close$"),
-        # menu_habits_remove is intentionally excluded here: remove_habit_conversation
-        # handles it in group 0. Bridging it in group 1 also posts command text.
-        CallbackQueryHandler(bridge_command_callback, pattern="^(menu_habit_done|menu_habit_done_date|menu_streaks|menu_help|menu_habits_add|menu_habits_revert|menu_rewards_list|menu_rewards_my|menu_rewards_claimed)$"),
-        CallbackQueryHandler(open_start_menu_callback, pattern="^menu_back_start$"),
-        CallbackQueryHandler(open_habits_menu_callback, pattern="^menu_back_habits$"),
-        CallbackQueryHandler(generic_back_callback, pattern="^menu_back$"),
-        # Settings standalone handlers (work outside conversation)
-        CallbackQueryHandler(settings_language_callback, pattern="^settings_language$"),
-        CallbackQueryHandler(change_language_standalone_callback, pattern="^lang_(en|kk|ru)$"),
-        CallbackQueryHandler(settings_back_callback, pattern="^settings_back$"),
-        # Habit display handler (view only, no action)
-        CallbackQueryHandler(view_habit_display_callback, pattern="^view_habit_"),
-        # Simple habit flow handler (one-click completion for today)
-        # This must come BEFORE habit_selected_standalone_callback
-        CallbackQueryHandler(simple_habit_selected_callback, pattern="^simple_habit_"),
-        # Menu habit_done flow handlers (Today/Yesterday/Select Date buttons)
-        CallbackQueryHandler(menu_habit_today_callback, pattern="^habit_.*_today$"),
-        CallbackQueryHandler(menu_habit_yesterday_callback, pattern="^habit_.*_yesterday$"),
-        CallbackQueryHandler(menu_select_date_callback, pattern="^backdate_habit_"),
-        CallbackQueryHandler(menu_backdate_date_selected_callback, pattern="^backdate_date_"),
-        CallbackQueryHandler(menu_backdate_confirm_callback, pattern="^backdate_confirm_"),
-        CallbackQueryHandler(menu_backdate_cancel_callback, pattern="^backdate_cancel$"),
-        # Habit selection standalone handler (work outside conversation)
-        # This must be LAST to avoid catching other habit_* patterns
-        CallbackQueryHandler(habit_selected_standalone_callback, pattern="^habit_")
-    ]
+    return _MENU_HANDLERS
@@ -0,0 +1,91 @@
+"""Handler table shared by the polling (main.py) and webhook entry points."""
+
+from collections.abc import Collection
+
+from src.bot.handlers.command_dispatch import CommandDispatchHandler
+from src.bot.handlers.command_handlers import start_command, help_command
+from src.bot.handlers.habit_done_handler import habit_done_conversation
+from src.bot.handlers.habit_revert_handler import habit_revert_conversation
+from src.bot.handlers.backdate_handler import backdate_conversation
+from src.bot.handlers.habit_management_handler import (
+    add_habit_conversation,
+    edit_habit_conversation,
+    remove_habit_conversation
+)
+from src.bot.handlers.reward_handlers import (
+    list_rewards_command,
+    my_rewards_command,
+    claimed_rewards_command,
+    claim_reward_conversation,
+    add_reward_conversation,
+    edit_reward_conversation,
+    toggle_reward_conversation,
+)
+from src.bot.handlers.streak_handler import streaks_command
+from src.bot.handlers.menu_handler import get_menu_handlers
+from src.bot.handlers.settings_handler import settings_conversation
+from src.bot.handlers.web_login_handler import web_login_handler
+
+# Stateless commands, routed by name through a dispatcher handler. None of the
+# conversations below accept command text in their states, so the dispatchers
+# never compete with them.
+COMMANDS = {
+    "start": start_command,
+    "help": help_command,
+    "list_rewards": list_rewards_command,
+    "my_rewards": my_rewards_command,
+    "claimed_rewards": claimed_rewards_command,
+    "streaks": streaks_command,
+}
+
+# Group 0 handlers after the command dispatchers, in registration order. PTB
+# tries handlers within a group in order and stops at the first one that matches.
+CONVERSATIONS = (
+    # Habit logging conversations
+    habit_done_conversation,
+    habit_revert_conversation,
+    backdate_conversation,
+    # Habit management conversations
+    add_habit_conversation,
+    edit_habit_conversation,
+    remove_habit_conversation,
+    # Reward conversations
+    claim_reward_conversation,
+    add_reward_conversation,
+    edit_reward_conversation,
+    toggle_reward_conversation,
+    # Settings
+    settings_conversation,
+)
+
+
+def get_handler_groups(non_blocking_commands: Collection[str] = ()) -> dict[int, tuple]:
+    """
+    Build the handler groups to pass to Application.add_handlers().
+
+    Commands are blocking unless named in non_blocking_commands, which get a
+    separate block=False dispatcher. Only pass them when the application is
+    started (polling): webhook mode only initializes it, so PTB would neither
+    track nor await those tasks, and the webhook would answer before they ran.
+
+    Web login and menu callbacks run in group 1 alongside the conversations
+    (group 0 ends conversations; group 1 handles navigation), so an active
+    conversation takes precedence.
+
+    Args:
+        non_blocking_commands: Names from COMMANDS to run as tasks
+
+    Returns:
+        Mapping of handler group to handlers, in registration order
+    """
+    dispatchers = []
+    non_blocking = {name: COMMANDS[name] for name in non_blocking_commands}
+    if non_blocking:
+        dispatchers.append(CommandDispatchHandler(non_blocking, block=False))
+    blocking = {name: callback for name, callback in COMMANDS.items() if name not in non_blocking}
+    if blocking:
+        dispatchers.append(CommandDispatchHandler(blocking))
+    return {
+        0: (*dispatchers, *CONVERSATIONS),
+        1: (web_login_handler, *get_menu_handlers()),
+    }
@@ -352,10 +352,7 @@ async def api_key_name_entered(update: Update, context: ContextTypes.DEFAULT_TYP
         logger.info(f"✅ API key '{key_name}' created for user {telegram_id}")
 
         # Send the key (shown ONCE)
-        message = msg('API_KEY_CREATED', lang).format(
-            name=html.escape(key_name),
-            key=raw_key,
-        )
+        message = msg('API_KEY_CREATED', lang, name=html.escape(key_name), key=raw_key)
 
         key_message = await update.message.reply_text(
             message,
@@ -1,12 +1,191 @@
 """Inline keyboard builders for Telegram bot."""
 
-from datetime import date
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Sequence
+from datetime import date, timedelta
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-from src.models.habit import Habit
-from src.models.reward import Reward
-from src.models.reward_progress import RewardProgress
-from src.bot.messages import msg
+from src.bot.messages import Messages, msg
+from src.config import HABIT_CATEGORIES
+
+if TYPE_CHECKING:
+    # Models are only referenced in annotations
+    from src.models.habit import Habit
+    from src.models.reward import Reward
+    from src.models.reward_progress import RewardProgress
+
+
+# Labels used by the per-call builders, resolved together the first time a
+# language is used, so catalogs of languages nobody uses are never loaded.
+# Keys used only inside cached builders go through msg().
+_BUTTON_TEXT_KEYS = (
+    'BUTTON_SKIP', 'BUTTON_CLEAR', 'MENU_CANCEL', 'BUTTON_YES', 'BUTTON_NO', 'MENU_BACK',
+    'BUTTON_TODAY', 'BUTTON_YESTERDAY', 'BUTTON_SELECT_DATE', 'BUTTON_ADD_HABIT',
+    'BUTTON_EXEMPT_NONE', 'BUTTON_EXEMPT_WEEKENDS',
+)
+
+
+@lru_cache(maxsize=8)
+def _button_texts(language: str) -> dict[str, str]:
+    """Return the _BUTTON_TEXT_KEYS labels for a language."""
+    return dict(zip(_BUTTON_TEXT_KEYS, Messages.get_many(_BUTTON_TEXT_KEYS, language)))
+
+
+def _m(key: str, language: str) -> str:
+    """Return the translated button label, from the per-language table when available."""
+    text = _button_texts(language).get(key)
+    return text if text is not None else msg(key, language)
+
+
+@lru_cache(maxsize=64)
+def _back_button(language: str, callback: str = "menu_back") -> InlineKeyboardButton:
+    """Return the shared Back button for a language and callback."""
+    return InlineKeyboardButton(text=_m('MENU_BACK', language), callback_data=callback)
+
+
+@lru_cache(maxsize=32)
+def _cancel_button(language: str, callback: str = "cancel_habit_flow") -> InlineKeyboardButton:
+    """Return the shared Cancel button for a language and callback."""
+    return InlineKeyboardButton(text=_m('MENU_CANCEL', language), callback_data=callback)
+
+
+@lru_cache(maxsize=32)
+def _skip_button(language: str, callback: str) -> InlineKeyboardButton:
+    """Return the shared Skip button for a language and callback."""
+    return InlineKeyboardButton(text=_m('BUTTON_SKIP', language), callback_data=callback)
+
+
+# Builders decorated with @lru_cache below depend only on their (hashable)
+# arguments, usually just the language. python-telegram-bot freezes
+# InlineKeyboardMarkup after construction, so handing out the same instance
+# on every call is safe.
+
+
+# Category buttons never change, so build the un-highlighted rows once at import.
+# Callback strings in these long-lived tables are interned so the plain and
+# checkmarked variants share one object; per-request callbacks are not, since
+# they are discarded once the message is sent.
+_CATEGORY_CALLBACKS = [sys.intern(f"category_{category_id}") for category_id, _ in HABIT_CATEGORIES]
+_CATEGORY_ROWS_PLAIN = [
+    (InlineKeyboardButton(text=category_display, callback_data=callback),)
+    for (_, category_display), callback in zip(HABIT_CATEGORIES, _CATEGORY_CALLBACKS)
+]
+_CATEGORY_ROWS_CHECKED = [
+    (InlineKeyboardButton(text=f"✓ {category_display}", callback_data=callback),)
+    for (_, category_display), callback in zip(HABIT_CATEGORIES, _CATEGORY_CALLBACKS)
+]
+_CATEGORY_INDEX = {category_id: idx for idx, (category_id, _) in enumerate(HABIT_CATEGORIES)}
+
+# Quick reward weight options (10..100), three per row, shared by the create
+# and edit flows
+_REWARD_WEIGHT_PRESETS = tuple(range(10, 101, 10))
+_REWARD_WEIGHT_ROW_SIZE = 3
+_HABIT_WEIGHT_PRESETS = (0, 5, 10, 15, 20, 25, 30)
+_HABIT_WEIGHT_ROW_SIZE = 4
+_GRACE_DAYS_PRESETS = (0, 1, 2, 3)
+
+# (plain, checkmarked) texts for every numeric preset, indexed by "is current"
+_PRESET_TEXTS = {
+    value: (str(value), f"✓ {value}")
+    for value in (*_REWARD_WEIGHT_PRESETS, *_HABIT_WEIGHT_PRESETS, *_GRACE_DAYS_PRESETS)
+}
+
+
+def _preset_rows(values, callback_prefix: str, row_size: int) -> list[tuple[InlineKeyboardButton, ...]]:
+    """Build un-highlighted preset buttons chunked into rows of row_size."""
+    buttons = tuple(
+        InlineKeyboardButton(text=_PRESET_TEXTS[value][0], callback_data=sys.intern(f"{callback_prefix}{value}"))
+        for value in values
+    )
+    return [buttons[i:i + row_size] for i in range(0, len(buttons), row_size)]
+
+
+_REWARD_WEIGHT_ROWS = _preset_rows(_REWARD_WEIGHT_PRESETS, "reward_weight_", _REWARD_WEIGHT_ROW_SIZE)
+_REWARD_EDIT_WEIGHT_ROWS = _preset_rows(_REWARD_WEIGHT_PRESETS, "edit_reward_weight_", _REWARD_WEIGHT_ROW_SIZE)
+
+# Grace days fit in one row; prebuild it for every possible highlight so the
+# builder only picks a row
+_GRACE_DAYS_ROW_PLAIN = _preset_rows(_GRACE_DAYS_PRESETS, "grace_days_", len(_GRACE_DAYS_PRESETS))[0]
+_GRACE_DAYS_ROWS = {
+    current: tuple(
+        InlineKeyboardButton(text=_PRESET_TEXTS[days][1], callback_data=button.callback_data)
+        if days == current else button
+        for days, button in zip(_GRACE_DAYS_PRESETS, _GRACE_DAYS_ROW_PLAIN)
+    )
+    for current in _GRACE_DAYS_PRESETS
+}
+
+# Per-row claim button texts, formatted once per reward in the claim keyboards
+_CLAIM_BUTTON_FORMAT = "✅ Claim: %s/%s pieces"
+_CLAIMABLE_REWARD_FORMAT = "%s (%s/%s)"
+
+# (active, is_recurring) -> (prefix, suffix) for reward toggle buttons:
+# ✅/❌ for active/inactive, 🔄/🔒 for recurring/non-recurring
+_TOGGLE_FORMATS = {
+    (True, True): ("✅ ", " (🔄)"),
+    (True, False): ("✅ ", " (🔒)"),
+    (False, True): ("❌ ", " (🔄)"),
+    (False, False): ("❌ ", " (🔒)"),
+}
+
+# Fetches (name, id) in one C-level call for list keyboards
+_name_and_id = attrgetter("name", "id")
+
+
+def _habit_flow_tail_rows(language: str, skip_callback: str | None = None) -> list[tuple[InlineKeyboardButton, ...]]:
+    """
+    Build the trailing Skip/Cancel rows shared by habit flow keyboards.
+
+    Builders compose these rows with their own and wrap the result in
+    InlineKeyboardMarkup once, at the end.
+
+    Args:
+        language: Language code for translating button text
+        skip_callback: If provided, adds a Skip row with this callback data
+
+    Returns:
+        List of keyboard rows (Skip if requested, then Cancel)
+    """
+    rows = []
+    if skip_callback:
+        rows.append((_skip_button(language, skip_callback),))
+    rows.append((_cancel_button(language),))
+    return rows
+
+
+def _build_habit_list_keyboard(
+    habits: list[Habit],
+    callback_prefix: str,
+    back_callback: str,
+    language: str,
+) -> InlineKeyboardMarkup:
+    """
+    Build a one-habit-per-row keyboard followed by a Back button.
+
+    Shared by the habit selection builders, which differ only in the
+    callback prefix and where Back leads.
+
+    Args:
+        habits: Habits to display, in order
+        callback_prefix: Prefix for each habit button's callback_data (habit id is appended)
+        back_callback: Callback data for the Back button
+        language: Language code for translating Back button text
+
+    Returns:
+        InlineKeyboardMarkup with habit buttons and Back button
+    """
+    keyboard = [
+        (InlineKeyboardButton(text=name, callback_data=callback_prefix + str(habit_id)),)
+        for name, habit_id in map(_name_and_id, habits)
+    ]
+    keyboard.append((_back_button(language, back_callback),))
+
+    return InlineKeyboardMarkup(keyboard)
 
 
 def build_habit_selection_keyboard(habits: list[Habit], language: str = 'en') -> InlineKeyboardMarkup:
@@ -20,23 +199,7 @@ def build_habit_selection_keyboard(habits: list[Habit], language: str = 'en') ->
     Returns:
         InlineKeyboardMarkup with habit buttons and Back button
     """
-    keyboard = []
-    for habit in habits:
-        button = InlineKeyboardButton(
-            text=habit.name,
-            callback_data=f"habit_{habit.id}"
-        )
-        keyboard.append([button])
-
-    # Add Back button to return to main menu
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data="menu_back"
-        )
-    ])
-
-    return InlineKeyboardMarkup(keyboard)
+    return _build_habit_list_keyboard(habits, "habit_", "menu_back", language)
 
 
 def build_simple_habit_selection_keyboard(habits: list[Habit], language: str = 'en') -> InlineKeyboardMarkup:
@@ -53,23 +216,7 @@ def build_simple_habit_selection_keyboard(habits: list[Habit], language: str = '
     Returns:
         InlineKeyboardMarkup with habit buttons (simple_ prefix) and Back button
     """
-    keyboard = []
-    for habit in habits:
-        button = InlineKeyboardButton(
-            text=habit.name,
-            callback_data=f"simple_habit_{habit.id}"
-        )
-        keyboard.append([button])
-
-    # Add Back button to return to main menu
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data="menu_back"
-        )
-    ])
-
-    return InlineKeyboardMarkup(keyboard)
+    return _build_habit_list_keyboard(habits, "simple_habit_", "menu_back", language)
 
 
 def build_habit_revert_keyboard(habits: list[Habit], language: str = 'en') -> InlineKeyboardMarkup:
@@ -83,23 +230,7 @@ def build_habit_revert_keyboard(habits: list[Habit], language: str = 'en') -> In
     Returns:
         InlineKeyboardMarkup with habit buttons and Back button
     """
-    keyboard = []
-    for habit in habits:
-        keyboard.append([
-            InlineKeyboardButton(
-                text=habit.name,
-                callback_data=f"revert_habit_{habit.id}"
-            )
-        ])
-
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data="menu_back"
-        )
-    ])
-
-    return InlineKeyboardMarkup(keyboard)
+    return _build_habit_list_keyboard(habits, "revert_habit_", "menu_back", language)
 
 
 def build_reward_status_keyboard(progress: RewardProgress) -> InlineKeyboardMarkup:
@@ -113,14 +244,14 @@ def build_reward_status_keyboard(progress: RewardProgress) -> InlineKeyboardMark
         InlineKeyboardMarkup with status buttons
     """
     keyboard = [
-        [InlineKeyboardButton(
+        (InlineKeyboardButton(
             text="✅ Mark as Completed",
             callback_data=f"complete_reward_{progress.reward_id}"
-        )],
-        [InlineKeyboardButton(
+        ),),
+        (InlineKeyboardButton(
             text="🕒 Reset to Pending",
             callback_data=f"reset_reward_{progress.reward_id}"
-        )]
+        ),)
     ]
 
     return InlineKeyboardMarkup(keyboard)
@@ -140,13 +271,13 @@ def build_actionable_rewards_keyboard(rewards: list[RewardProgress]) -> InlineKe
     if not rewards:
         return None
 
-    keyboard = []
-    for progress in rewards:
-        button = InlineKeyboardButton(
-            text=f"✅ Claim: {progress.pieces_earned}/{progress.get_pieces_required() or 1} pieces",
+    keyboard = [
+        (InlineKeyboardButton(
+            text=_CLAIM_BUTTON_FORMAT % (progress.pieces_earned, progress.get_pieces_required() or 1),
             callback_data=f"claim_reward_{progress.reward_id}"
-        )
-        keyboard.append([button])
+        ),)
+        for progress in rewards
+    ]
 
     return InlineKeyboardMarkup(keyboard)
 
@@ -154,7 +285,7 @@ def build_actionable_rewards_keyboard(rewards: list[RewardProgress]) -> InlineKe
 
 def build_claimable_rewards_keyboard(
     progress_list: list[RewardProgress],
-    rewards_dict: dict[str, 'Reward'],
+    rewards_dict: dict[str, Reward],
     language: str = 'en'
 ) -> InlineKeyboardMarkup | None:
     """
@@ -163,7 +294,7 @@ def build_claimable_rewards_keyboard(
     Args:
         progress_list: List of achieved RewardProgress objects
         rewards_dict: Dictionary mapping reward_id to Reward object
-        language: Language code (not currently used, reserved for future use)
+        language: Language code for the Back button
 
     Returns:
         InlineKeyboardMarkup with claim buttons or None if no rewards
@@ -176,24 +307,22 @@ def build_claimable_rewards_keyboard(
         reward = rewards_dict.get(progress.reward_id)
         if reward:
             # Format: "Reward Name (X/Y pieces)"
-            button_text = f"{reward.name} ({progress.pieces_earned}/{progress.get_pieces_required() or 1})"
+            # The reward is already at hand, so read pieces_required from it
+            # instead of going through progress.get_pieces_required()
+            button_text = _CLAIMABLE_REWARD_FORMAT % (reward.name, progress.pieces_earned, reward.pieces_required or 1)
             button = InlineKeyboardButton(
                 text=button_text,
                 callback_data=f"claim_reward_{progress.reward_id}"
             )
-            keyboard.append([button])
+            keyboard.append((button,))
 
     # Add Back button to return to rewards menu
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data="claim_reward_back"
-        )
-    ])
+    keyboard.append((_back_button(language, "claim_reward_back"),))
 
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=8)
 def build_settings_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """
     Build inline keyboard for settings menu.
@@ -205,26 +334,23 @@ def build_settings_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
         InlineKeyboardMarkup with settings options and Back button
     """
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('SETTINGS_SELECT_LANGUAGE', language),
+        (InlineKeyboardButton(
+            text=_m('SETTINGS_SELECT_LANGUAGE', language),
             callback_data="settings_language"
-        )],
-        [InlineKeyboardButton(
-            text=msg('SETTINGS_TIMEZONE', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('SETTINGS_TIMEZONE', language),
             callback_data="settings_timezone"
-        )],
-        [InlineKeyboardButton(
-            text=msg('SETTINGS_API_KEYS', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('SETTINGS_API_KEYS', language),
             callback_data="settings_api_keys"
-        )],
-        [InlineKeyboardButton(
-            text=msg('SETTINGS_NO_REWARD_PROB', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('SETTINGS_NO_REWARD_PROB', language),
             callback_data="settings_no_reward_prob"
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data="menu_back"
-        )]
+        ),),
+        (_back_button(language),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
@@ -234,29 +360,35 @@ def build_no_reward_probability_keyboard(current_value: float, language: str = '
     Build inline keyboard for no reward probability selection.
 
     Args:
-        current_value: Current probability value
+        current_value: Current probability value (shown in the message text,
+            not on the keyboard)
         language: Language code for translating button text
 
     Returns:
         InlineKeyboardMarkup with preset options (25%, 50%, 75%), Custom, and Cancel
     """
+    return _no_reward_probability_keyboard(language)
+
+
+@lru_cache(maxsize=8)
+def _no_reward_probability_keyboard(language: str) -> InlineKeyboardMarkup:
     # Preset buttons in a row
-    presets = [
+    presets = (
         InlineKeyboardButton(text="25%", callback_data="no_reward_prob_25"),
         InlineKeyboardButton(text="50%", callback_data="no_reward_prob_50"),
         InlineKeyboardButton(text="75%", callback_data="no_reward_prob_75"),
-    ]
+    )
 
     keyboard = [
         presets,  # 25%, 50%, 75% in one row
-        [InlineKeyboardButton(
-            text=msg('NO_REWARD_PROB_CUSTOM', language),
+        (InlineKeyboardButton(
+            text=_m('NO_REWARD_PROB_CUSTOM', language),
             callback_data="no_reward_prob_custom"
-        )],
-        [InlineKeyboardButton(
-            text=msg('SETTINGS_BACK', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('SETTINGS_BACK', language),
             callback_data="settings_back"
-        )],
+        ),),
     ]
     return InlineKeyboardMarkup(keyboard)
 
@@ -288,24 +420,25 @@ def build_timezone_selection_keyboard(current_timezone: str = 'UTC', language: s
     keyboard = []
     for tz_id, tz_label in timezones:
         text = f"✓ {tz_label}" if current_timezone == tz_id else tz_label
-        keyboard.append([InlineKeyboardButton(
+        keyboard.append((InlineKeyboardButton(
             text=text,
             callback_data=f"tz_{tz_id}"
-        )])
+        ),))
 
-    keyboard.append([InlineKeyboardButton(
-        text=msg('TIMEZONE_CUSTOM', language),
+    keyboard.append((InlineKeyboardButton(
+        text=_m('TIMEZONE_CUSTOM', language),
         callback_data="tz_custom"
-    )])
+    ),))
 
-    keyboard.append([InlineKeyboardButton(
-        text=msg('SETTINGS_BACK', language),
+    keyboard.append((InlineKeyboardButton(
+        text=_m('SETTINGS_BACK', language),
         callback_data="settings_back"
-    )])
+    ),))
 
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=8)
 def build_language_selection_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """
     Build inline keyboard for language selection.
@@ -317,22 +450,22 @@ def build_language_selection_keyboard(language: str = 'en') -> InlineKeyboardMar
         InlineKeyboardMarkup with language options
     """
     keyboard = [
-        [InlineKeyboardButton(
+        (InlineKeyboardButton(
             text="🇬🇧 English",
             callback_data="lang_en"
-        )],
-        [InlineKeyboardButton(
+        ),),
+        (InlineKeyboardButton(
             text="🇰🇿 Қазақша",
             callback_data="lang_kk"
-        )],
-        [InlineKeyboardButton(
+        ),),
+        (InlineKeyboardButton(
             text="🇷🇺 Русский",
             callback_data="lang_ru"
-        )],
-        [InlineKeyboardButton(
-            text=msg('SETTINGS_BACK', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('SETTINGS_BACK', language),
             callback_data="settings_back"
-        )]
+        ),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
@@ -356,44 +489,16 @@ def build_weight_selection_keyboard(
     Returns:
         InlineKeyboardMarkup with weight buttons
     """
-    weight_values = [0, 5, 10, 15, 20, 25, 30]
-    keyboard = []
-    row = []
-
-    for weight in weight_values:
-        # Highlight current weight with checkmark
-        button_text = f"✓ {weight}" if current_weight == weight else str(weight)
-        button = InlineKeyboardButton(
-            text=button_text,
-            callback_data=f"weight_{weight}"
-        )
-        row.append(button)
+    # Highlight current weight with checkmark
+    buttons = tuple(
+        InlineKeyboardButton(text=_PRESET_TEXTS[weight][current_weight == weight], callback_data=f"weight_{weight}")
+        for weight in _HABIT_WEIGHT_PRESETS
+    )
 
-        # Create rows of 4 buttons each
-        if len(row) == 4:
-            keyboard.append(row)
-            row = []
-
-    # Add remaining buttons
-    if row:
-        keyboard.append(row)
-
-    # Add Skip button if requested
-    if skip_callback:
-        keyboard.append([
-            InlineKeyboardButton(
-                text=msg('BUTTON_SKIP', language),
-                callback_data=skip_callback
-            )
-        ])
+    # Create rows of 4 buttons each
+    keyboard = [buttons[i:i + _HABIT_WEIGHT_ROW_SIZE] for i in range(0, len(buttons), _HABIT_WEIGHT_ROW_SIZE)]
 
-    # Add Cancel button
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_habit_flow"
-        )
-    ])
+    keyboard.extend(_habit_flow_tail_rows(language, skip_callback))
 
     return InlineKeyboardMarkup(keyboard)
 
@@ -415,35 +520,13 @@ def build_category_selection_keyboard(
     Returns:
         InlineKeyboardMarkup with category buttons
     """
-    from src.config import HABIT_CATEGORIES
-
-    keyboard = []
-
-    for category_id, category_display in HABIT_CATEGORIES:
-        # Highlight current category with checkmark
-        button_text = f"✓ {category_display}" if current_category == category_id else category_display
-        button = InlineKeyboardButton(
-            text=button_text,
-            callback_data=f"category_{category_id}"
-        )
-        keyboard.append([button])
-
-    # Add Skip button if requested
-    if skip_callback:
-        keyboard.append([
-            InlineKeyboardButton(
-                text=msg('BUTTON_SKIP', language),
-                callback_data=skip_callback
-            )
-        ])
+    # Reuse the prebuilt rows; only the highlighted category needs a new button
+    keyboard = list(_CATEGORY_ROWS_PLAIN)
+    idx = _CATEGORY_INDEX.get(current_category)
+    if idx is not None:
+        keyboard[idx] = _CATEGORY_ROWS_CHECKED[idx]
 
-    # Add Cancel button
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_habit_flow"
-        )
-    ])
+    keyboard.extend(_habit_flow_tail_rows(language, skip_callback))
 
     return InlineKeyboardMarkup(keyboard)
 
@@ -461,29 +544,10 @@ def build_habits_for_edit_keyboard(habits: list[Habit], operation: str, language
     Returns:
         InlineKeyboardMarkup with habit buttons and Back button
     """
-    keyboard = []
-
-    for habit in habits:
-        # Display format: "Habit Name" (no category)
-        display_text = habit.name
-
-        callback_prefix = "edit_habit" if operation == "edit" else "remove_habit"
-        button = InlineKeyboardButton(
-            text=display_text,
-            callback_data=f"{callback_prefix}_{habit.id}"
-        )
-        keyboard.append([button])
-
-    # Add Back button to return to habits menu
-    callback_back = "edit_back" if operation == "edit" else "remove_back"
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data=callback_back
-        )
-    ])
-
-    return InlineKeyboardMarkup(keyboard)
+    # Display format: "Habit Name" (no category); Back returns to habits menu
+    if operation == "edit":
+        return _build_habit_list_keyboard(habits, "edit_habit_", "edit_back", language)
+    return _build_habit_list_keyboard(habits, "remove_habit_", "remove_back", language)
 
 
 
@@ -500,42 +564,33 @@ def build_post_create_habit_keyboard(habits: list[Habit], language: str = 'en')
     Returns:
         InlineKeyboardMarkup with habit list display and action buttons
     """
-    keyboard = []
-
-    # Display all habits (non-clickable, just for display) - no category
-    for habit in habits:
-        display_text = f"• {habit.name}"
-        # Use a dummy callback to make it non-interactive
-        button = InlineKeyboardButton(
-            text=display_text,
-            callback_data=f"view_habit_{habit.id}"
-        )
-        keyboard.append([button])
+    # Display all habits (non-clickable, just for display) - no category.
+    # The view_habit_ callback is a dummy to keep them non-interactive.
+    keyboard = [
+        (InlineKeyboardButton(text=f"• {name}", callback_data=f"view_habit_{habit_id}"),)
+        for name, habit_id in map(_name_and_id, habits)
+    ]
 
     # Add action buttons
-    keyboard.append([
+    keyboard.append((
         InlineKeyboardButton(
             text="➕ Add Another",
             callback_data="post_create_add_another"
-        )
-    ])
-    keyboard.append([
+        ),
+    ))
+    keyboard.append((
         InlineKeyboardButton(
             text="✏️ Edit Habit",
             callback_data="menu_habits_edit"
-        )
-    ])
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data="menu_back_habits"
-        )
-    ])
+        ),
+    ))
+    keyboard.append((_back_button(language, "menu_back_habits"),))
 
     return InlineKeyboardMarkup(keyboard)
 
 
 
+@lru_cache(maxsize=8)
 def build_cancel_only_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """
     Build inline keyboard with only a Cancel button.
@@ -549,14 +604,12 @@ def build_cancel_only_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
         InlineKeyboardMarkup with Cancel button only
     """
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_habit_flow"
-        )]
+        (_cancel_button(language),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=8)
 def build_skip_cancel_keyboard(language: str = 'en', skip_callback: str = 'skip_step') -> InlineKeyboardMarkup:
     """
     Build inline keyboard with Skip and Cancel buttons.
@@ -571,178 +624,138 @@ def build_skip_cancel_keyboard(language: str = 'en', skip_callback: str = 'skip_
         InlineKeyboardMarkup with Skip and Cancel buttons
     """
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_SKIP', language),
-            callback_data=skip_callback
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_habit_flow"
-        )]
+        (_skip_button(language, skip_callback),),
+        (_cancel_button(language),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=8)
 def build_reward_cancel_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """Build inline keyboard with Cancel button for reward flows."""
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_reward_flow"
-        )]
+        (_cancel_button(language, "cancel_reward_flow"),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
 
+@lru_cache(maxsize=8)
 def build_reward_weight_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """Build inline keyboard with quick weight options for reward creation."""
-    keyboard: list[list[InlineKeyboardButton]] = []
-    row: list[InlineKeyboardButton] = []
-
-    for idx, weight in enumerate(range(10, 101, 10), start=1):
-        row.append(InlineKeyboardButton(
-            text=str(weight),
-            callback_data=f"reward_weight_{weight}"
-        ))
-        if idx % 3 == 0:
-            keyboard.append(row)
-            row = []
-
-    if row:
-        keyboard.append(row)
-
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_reward_flow"
-        )
-    ])
+    keyboard = list(_REWARD_WEIGHT_ROWS)
+
+    keyboard.append((_cancel_button(language, "cancel_reward_flow"),))
 
     return InlineKeyboardMarkup(keyboard)
 
 
 
+@lru_cache(maxsize=8)
 def build_reward_pieces_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """Build inline keyboard for pieces required with quick option for non-accumulative rewards."""
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_PIECES_NOT_ACCUMULATIVE', language),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_PIECES_NOT_ACCUMULATIVE', language),
             callback_data="reward_pieces_1"
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_reward_flow"
-        )]
+        ),),
+        (_cancel_button(language, "cancel_reward_flow"),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=8)
 def build_recurring_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """Build inline keyboard for recurring reward selection (Yes/No)."""
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_RECURRING_YES', language),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_RECURRING_YES', language),
             callback_data="reward_recurring_yes"
-        )],
-        [InlineKeyboardButton(
-            text=msg('BUTTON_RECURRING_NO', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_RECURRING_NO', language),
             callback_data="reward_recurring_no"
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_reward_flow"
-        )]
+        ),),
+        (_cancel_button(language, "cancel_reward_flow"),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
+# typed=True keeps 1/0 from sharing a cache entry with True/False: only the
+# bool values get a checkmark
+@lru_cache(maxsize=16, typed=True)
 def build_reward_edit_recurring_keyboard(
     *,
     current_is_recurring: bool | None = None,
     language: str = 'en',
 ) -> InlineKeyboardMarkup:
     """Build inline keyboard for recurring selection during reward edit (with Skip/Cancel)."""
-    yes_text = msg('BUTTON_RECURRING_YES', language)
-    no_text = msg('BUTTON_RECURRING_NO', language)
+    yes_text = _m('BUTTON_RECURRING_YES', language)
+    no_text = _m('BUTTON_RECURRING_NO', language)
     if current_is_recurring is True:
         yes_text = f"✓ {yes_text}"
     elif current_is_recurring is False:
         no_text = f"✓ {no_text}"
 
     keyboard = [
-        [InlineKeyboardButton(
+        (InlineKeyboardButton(
             text=yes_text,
             callback_data="reward_recurring_yes"
-        )],
-        [InlineKeyboardButton(
+        ),),
+        (InlineKeyboardButton(
             text=no_text,
             callback_data="reward_recurring_no"
-        )],
-        [InlineKeyboardButton(
-            text=msg('BUTTON_SKIP', language),
-            callback_data="reward_edit_recurring_skip"
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_reward_flow"
-        )],
+        ),),
+        (_skip_button(language, "reward_edit_recurring_skip"),),
+        (_cancel_button(language, "cancel_reward_flow"),),
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=8)
 def build_reward_piece_value_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """Build inline keyboard for optional piece value with skip/cancel buttons."""
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_SKIP', language),
-            callback_data="reward_value_skip"
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_reward_flow"
-        )]
+        (_skip_button(language, "reward_value_skip"),),
+        (_cancel_button(language, "cancel_reward_flow"),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
-
+@lru_cache(maxsize=8)
 def build_reward_confirmation_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """Build inline keyboard for confirming reward creation."""
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_CONFIRM', language),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_CONFIRM', language),
             callback_data="reward_confirm_save"
-        )],
-        [InlineKeyboardButton(
-            text=msg('BUTTON_EDIT_REWARD', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_EDIT_REWARD', language),
             callback_data="reward_confirm_edit"
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_reward_flow"
-        )]
+        ),),
+        (_cancel_button(language, "cancel_reward_flow"),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
-
+@lru_cache(maxsize=8)
 def build_reward_post_create_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """Build inline keyboard shown after reward creation."""
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_ADD_ANOTHER_REWARD', language),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_ADD_ANOTHER_REWARD', language),
             callback_data="reward_add_another"
-        )],
-        [InlineKeyboardButton(
-            text=msg('BUTTON_BACK_TO_REWARDS', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_BACK_TO_REWARDS', language),
             callback_data="reward_back_to_rewards"
-        )]
+        ),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
-
+@lru_cache(maxsize=8)
 def build_habit_confirmation_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """
     Build inline keyboard for habit confirmation (Yes/No/Cancel).
@@ -754,23 +767,32 @@ def build_habit_confirmation_keyboard(language: str = 'en') -> InlineKeyboardMar
         InlineKeyboardMarkup with Yes/No/Cancel buttons
     """
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_YES', language),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_YES', language),
             callback_data="confirm_yes"
-        )],
-        [InlineKeyboardButton(
-            text=msg('BUTTON_NO', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_NO', language),
             callback_data="confirm_no"
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_habit_flow"
-        )]
+        ),),
+        (_cancel_button(language),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
 
+# (label key, callback_data) per button, one tuple per row
+_START_MENU_LAYOUT = (
+    (('BUTTON_HABIT_DONE', "menu_habit_done"),),
+    (('BUTTON_HABITS', "menu_habits"), ('BUTTON_REWARDS', "menu_rewards")),
+    (('BUTTON_ADD_HABIT', "menu_habits_add"), ('BUTTON_LIST_REWARDS', "menu_rewards_list")),
+    (('BUTTON_STREAKS', "menu_streaks"), ('BUTTON_SETTINGS', "menu_settings")),
+    (('BUTTON_HELP', "menu_help"), ('MENU_CLOSE', "menu_close")),
+)
+_START_MENU_KEYS = tuple(key for row in _START_MENU_LAYOUT for key, _ in row)
+
+
+@lru_cache(maxsize=8)
 def build_start_menu_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """
     Build inline keyboard for the main start menu.
@@ -778,61 +800,50 @@ def build_start_menu_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     Layout:
     [Habit Done]
     [Habits, Rewards]
+    [Add Habit, List Rewards]
     [Streaks, Settings]
     [Help, Close]
     """
+    labels = dict(zip(_START_MENU_KEYS, Messages.get_many(_START_MENU_KEYS, language)))
     keyboard = [
-        [InlineKeyboardButton(text=msg('BUTTON_HABIT_DONE', language), callback_data="menu_habit_done")],
-        [
-            InlineKeyboardButton(text=msg('BUTTON_HABITS', language), callback_data="menu_habits"),
-            InlineKeyboardButton(text=msg('BUTTON_REWARDS', language), callback_data="menu_rewards")
-        ],
-        [
-            InlineKeyboardButton(text=msg('BUTTON_ADD_HABIT', language), callback_data="menu_habits_add"),
-            InlineKeyboardButton(text=msg('BUTTON_LIST_REWARDS', language), callback_data="menu_rewards_list")
-        ],
-        [
-            InlineKeyboardButton(text=msg('BUTTON_STREAKS', language), callback_data="menu_streaks"),
-            InlineKeyboardButton(text=msg('BUTTON_SETTINGS', language), callback_data="menu_settings")
-        ],
-        [
-            InlineKeyboardButton(text=msg('BUTTON_HELP', language), callback_data="menu_help"),
-            InlineKeyboardButton(text=msg('MENU_CLOSE', language), callback_data="menu_close")
-        ]
+        tuple(InlineKeyboardButton(text=labels[key], callback_data=callback) for key, callback in row)
+        for row in _START_MENU_LAYOUT
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
 
+@lru_cache(maxsize=8)
 def build_habits_menu_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """
     Build inline keyboard for the habits submenu.
     """
     keyboard = [
-        [InlineKeyboardButton(text=msg('BUTTON_ADD_HABIT', language), callback_data="menu_habits_add")],
-        [InlineKeyboardButton(text=msg('BUTTON_EDIT_HABIT', language), callback_data="menu_habits_edit")],
-        [InlineKeyboardButton(text=msg('BUTTON_REMOVE_HABIT', language), callback_data="menu_habits_remove")],
-        [InlineKeyboardButton(text=msg('BUTTON_REVERT_HABIT', language), callback_data="menu_habits_revert")],
-        [InlineKeyboardButton(text=msg('BUTTON_HABIT_DONE_DATE', language), callback_data="menu_habit_done_date")],
-        [InlineKeyboardButton(text=msg('MENU_BACK', language), callback_data="menu_back_start")]
+        (InlineKeyboardButton(text=_m('BUTTON_ADD_HABIT', language), callback_data="menu_habits_add"),),
+        (InlineKeyboardButton(text=_m('BUTTON_EDIT_HABIT', language), callback_data="menu_habits_edit"),),
+        (InlineKeyboardButton(text=_m('BUTTON_REMOVE_HABIT', language), callback_data="menu_habits_remove"),),
+        (InlineKeyboardButton(text=_m('BUTTON_REVERT_HABIT', language), callback_data="menu_habits_revert"),),
+        (InlineKeyboardButton(text=_m('BUTTON_HABIT_DONE_DATE', language), callback_data="menu_habit_done_date"),),
+        (_back_button(language, "menu_back_start"),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
 
+@lru_cache(maxsize=8)
 def build_rewards_menu_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """
     Build inline keyboard for the rewards submenu.
     """
     keyboard = [
-        [InlineKeyboardButton(text=msg('BUTTON_ADD_REWARD', language), callback_data="menu_rewards_add")],
-        [InlineKeyboardButton(text=msg('BUTTON_EDIT_REWARD_MENU', language), callback_data="menu_rewards_edit")],
-        [InlineKeyboardButton(text=msg('BUTTON_TOGGLE_REWARD', language), callback_data="menu_reward_toggle")],
-        [InlineKeyboardButton(text=msg('BUTTON_LIST_REWARDS', language), callback_data="menu_rewards_list")],
-        [InlineKeyboardButton(text=msg('BUTTON_MY_REWARDS', language), callback_data="menu_rewards_my")],
-        [InlineKeyboardButton(text=msg('BUTTON_CLAIM_REWARD', language), callback_data="menu_rewards_claim")],
-        [InlineKeyboardButton(text=msg('BUTTON_CLAIMED_REWARDS', language), callback_data="menu_rewards_claimed")],
-        [InlineKeyboardButton(text=msg('MENU_BACK', language), callback_data="menu_back_start")]
+        (InlineKeyboardButton(text=_m('BUTTON_ADD_REWARD', language), callback_data="menu_rewards_add"),),
+        (InlineKeyboardButton(text=_m('BUTTON_EDIT_REWARD_MENU', language), callback_data="menu_rewards_edit"),),
+        (InlineKeyboardButton(text=_m('BUTTON_TOGGLE_REWARD', language), callback_data="menu_reward_toggle"),),
+        (InlineKeyboardButton(text=_m('BUTTON_LIST_REWARDS', language), callback_data="menu_rewards_list"),),
+        (InlineKeyboardButton(text=_m('BUTTON_MY_REWARDS', language), callback_data="menu_rewards_my"),),
+        (InlineKeyboardButton(text=_m('BUTTON_CLAIM_REWARD', language), callback_data="menu_rewards_claim"),),
+        (InlineKeyboardButton(text=_m('BUTTON_CLAIMED_REWARDS', language), callback_data="menu_rewards_claimed"),),
+        (_back_button(language, "menu_back_start"),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
@@ -842,22 +853,12 @@ def build_rewards_for_edit_keyboard(
     language: str = "en",
 ) -> InlineKeyboardMarkup:
     """Build inline keyboard for selecting a reward to edit."""
-    keyboard: list[list[InlineKeyboardButton]] = []
-
-    for reward in rewards:
-        keyboard.append([
-            InlineKeyboardButton(
-                text=reward.name,
-                callback_data=f"edit_reward_{reward.id}"
-            )
-        ])
+    keyboard: list[Sequence[InlineKeyboardButton]] = [
+        (InlineKeyboardButton(text=name, callback_data=f"edit_reward_{reward_id}"),)
+        for name, reward_id in map(_name_and_id, rewards)
+    ]
 
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data="reward_edit_back"
-        )
-    ])
+    keyboard.append((_back_button(language, "reward_edit_back"),))
 
     return InlineKeyboardMarkup(keyboard)
 
@@ -871,49 +872,29 @@ def build_rewards_for_toggle_keyboard(
     Shows ALL rewards (both active and inactive) with status indicators.
     Format: "{status_emoji} {name} ({recurring_indicator})"
     """
-    keyboard: list[list[InlineKeyboardButton]] = []
-
+    # Format: "✅ Reward Name (🔄)"
+    keyboard: list[Sequence[InlineKeyboardButton]] = []
     for reward in rewards:
-        # Status emoji: ✅ for active, ❌ for inactive
-        status_emoji = "✅" if reward.active else "❌"
+        prefix, suffix = _TOGGLE_FORMATS[bool(reward.active), bool(reward.is_recurring)]
+        keyboard.append((InlineKeyboardButton(
+            text=prefix + reward.name + suffix,
+            callback_data=f"toggle_reward_{reward.id}"
+        ),))
 
-        # Recurring indicator: 🔄 for recurring, 🔒 for non-recurring
-        recurring_emoji = "🔄" if reward.is_recurring else "🔒"
-
-        # Format: "✅ Reward Name (🔄)"
-        display_text = f"{status_emoji} {reward.name} ({recurring_emoji})"
-
-        keyboard.append([
-            InlineKeyboardButton(
-                text=display_text,
-                callback_data=f"toggle_reward_{reward.id}"
-            )
-        ])
-
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data="reward_toggle_back"
-        )
-    ])
+    keyboard.append((_back_button(language, "reward_toggle_back"),))
 
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=8)
 def build_reward_skip_cancel_keyboard(
     language: str = "en",
     skip_callback: str = "reward_edit_skip",
 ) -> InlineKeyboardMarkup:
     """Build inline keyboard with Skip and Cancel buttons for reward edit flow."""
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_SKIP', language),
-            callback_data=skip_callback
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_reward_flow"
-        )],
+        (_skip_button(language, skip_callback),),
+        (_cancel_button(language, "cancel_reward_flow"),),
     ]
     return InlineKeyboardMarkup(keyboard)
 
@@ -923,107 +904,91 @@ def build_reward_edit_weight_keyboard(
     language: str = "en",
 ) -> InlineKeyboardMarkup:
     """Build weight selection keyboard for reward edit flow (with Skip/Cancel)."""
-    keyboard: list[list[InlineKeyboardButton]] = []
-    row: list[InlineKeyboardButton] = []
-
-    # Quick options 10..100 (like create flow)
-    for idx, weight in enumerate(range(10, 101, 10), start=1):
-        is_current = False
-        if current_weight is not None:
-            try:
-                is_current = float(current_weight) == float(weight)
-            except Exception:
-                is_current = False
-        text = f"✓ {weight}" if is_current else str(weight)
-        row.append(InlineKeyboardButton(text=text, callback_data=f"edit_reward_weight_{weight}"))
-        if idx % 3 == 0:
-            keyboard.append(row)
-            row = []
-
-    if row:
-        keyboard.append(row)
-
-    keyboard.append([
-        InlineKeyboardButton(text=msg('BUTTON_SKIP', language), callback_data="edit_reward_weight_skip")
-    ])
-    keyboard.append([
-        InlineKeyboardButton(text=msg('MENU_CANCEL', language), callback_data="cancel_reward_flow")
-    ])
+    # Quick options 10..100 (like create flow); copy rows so the highlight stays local
+    keyboard = [list(row) for row in _REWARD_EDIT_WEIGHT_ROWS]
+
+    # Coerce once; presets are ints and compare equal to their float form
+    try:
+        current = float(current_weight) if current_weight is not None else None
+    except (TypeError, ValueError):
+        current = None
+
+    if current is not None:
+        for idx, weight in enumerate(_REWARD_WEIGHT_PRESETS):
+            if current == weight:
+                keyboard[idx // _REWARD_WEIGHT_ROW_SIZE][idx % _REWARD_WEIGHT_ROW_SIZE] = InlineKeyboardButton(
+                    text=_PRESET_TEXTS[weight][1],
+                    callback_data=f"edit_reward_weight_{weight}"
+                )
+                break
+
+    keyboard.append((_skip_button(language, "edit_reward_weight_skip"),))
+    keyboard.append((_cancel_button(language, "cancel_reward_flow"),))
 
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=8)
 def build_reward_edit_pieces_keyboard(language: str = "en") -> InlineKeyboardMarkup:
     """Build pieces selection keyboard for reward edit flow (quick 1 + Skip/Cancel)."""
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_PIECES_NOT_ACCUMULATIVE', language),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_PIECES_NOT_ACCUMULATIVE', language),
             callback_data="edit_reward_pieces_1"
-        )],
-        [InlineKeyboardButton(
-            text=msg('BUTTON_SKIP', language),
-            callback_data="edit_reward_pieces_skip"
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_reward_flow"
-        )],
+        ),),
+        (_skip_button(language, "edit_reward_pieces_skip"),),
+        (_cancel_button(language, "cancel_reward_flow"),),
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=8)
 def build_reward_edit_piece_value_keyboard(language: str = "en") -> InlineKeyboardMarkup:
     """Build piece value keyboard for reward edit flow (Skip/Clear/Cancel)."""
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_SKIP', language),
-            callback_data="edit_reward_value_skip"
-        )],
-        [InlineKeyboardButton(
-            text=msg('BUTTON_CLEAR', language),
+        (_skip_button(language, "edit_reward_value_skip"),),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_CLEAR', language),
             callback_data="edit_reward_value_clear"
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_reward_flow"
-        )],
+        ),),
+        (_cancel_button(language, "cancel_reward_flow"),),
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=8)
 def build_reward_edit_confirm_keyboard(language: str = "en") -> InlineKeyboardMarkup:
     """Build confirmation keyboard for reward edit flow."""
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_YES', language),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_YES', language),
             callback_data="reward_edit_confirm_yes"
-        )],
-        [InlineKeyboardButton(
-            text=msg('BUTTON_NO', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_NO', language),
             callback_data="reward_edit_confirm_no"
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_reward_flow"
-        )],
+        ),),
+        (_cancel_button(language, "cancel_reward_flow"),),
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
 
+@lru_cache(maxsize=8)
 def build_remove_confirmation_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """
     Build inline keyboard for remove confirmation with Back.
     """
     keyboard = [
-        [InlineKeyboardButton(text=msg('BUTTON_YES', language), callback_data="confirm_yes")],
-        [InlineKeyboardButton(text=msg('BUTTON_NO', language), callback_data="confirm_no")],
-        [InlineKeyboardButton(text=msg('MENU_BACK', language), callback_data="remove_back_to_list")]
+        (InlineKeyboardButton(text=_m('BUTTON_YES', language), callback_data="confirm_yes"),),
+        (InlineKeyboardButton(text=_m('BUTTON_NO', language), callback_data="confirm_no"),),
+        (_back_button(language, "remove_back_to_list"),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
 
+@lru_cache(maxsize=8)
 def build_no_habits_to_edit_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """
     Build inline keyboard for when no habits exist to edit.
@@ -1037,19 +1002,17 @@ def build_no_habits_to_edit_keyboard(language: str = 'en') -> InlineKeyboardMark
         InlineKeyboardMarkup with Add Habit and Back buttons
     """
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_ADD_HABIT', language),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_ADD_HABIT', language),
             callback_data="edit_add_habit"
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data="edit_back"
-        )]
+        ),),
+        (_back_button(language, "edit_back"),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
 
+@lru_cache(maxsize=8)
 def build_back_to_menu_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
     """
     Build inline keyboard with only a Back button to return to main menu.
@@ -1064,14 +1027,12 @@ def build_back_to_menu_keyboard(language: str = 'en') -> InlineKeyboardMarkup:
         InlineKeyboardMarkup with single Back button
     """
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data="menu_back"
-        )]
+        (_back_button(language),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=64)
 def build_grace_days_keyboard(
     current_grace_days: int | None = None, 
     language: str = 'en',
@@ -1088,37 +1049,10 @@ def build_grace_days_keyboard(
     Returns:
         InlineKeyboardMarkup with grace days buttons
     """
-    keyboard = []
-
-    # Create buttons for grace days (0-3)
-    row = []
-    for days in range(0, 4):
-        # Highlight current value with checkmark
-        button_text = f"✓ {days}" if current_grace_days == days else str(days)
-        button = InlineKeyboardButton(
-            text=button_text,
-            callback_data=f"grace_days_{days}"
-        )
-        row.append(button)
+    # Buttons for grace days (0-3), current value highlighted with checkmark
+    keyboard = [_GRACE_DAYS_ROWS.get(current_grace_days, _GRACE_DAYS_ROW_PLAIN)]
 
-    keyboard.append(row)
-
-    # Add Skip button if requested
-    if skip_callback:
-        keyboard.append([
-            InlineKeyboardButton(
-                text=msg('BUTTON_SKIP', language),
-                callback_data=skip_callback
-            )
-        ])
-
-    # Add Cancel button
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_habit_flow"
-        )
-    ])
+    keyboard.extend(_habit_flow_tail_rows(language, skip_callback))
 
     return InlineKeyboardMarkup(keyboard)
 
@@ -1139,46 +1073,48 @@ def build_exempt_days_keyboard(
     Returns:
         InlineKeyboardMarkup with exempt days buttons
     """
-    keyboard = []
-
     # Determine if current setting is None (empty list), Weekends (6,7), or Custom
     current_is_none = not current_exempt_days or len(current_exempt_days) == 0
-    current_is_weekends = current_exempt_days and sorted(current_exempt_days) == [6, 7]
+    # Exactly Saturday (6) and Sunday (7), in any order, without sorting a copy
+    current_is_weekends = (
+        not current_is_none
+        and len(current_exempt_days) == 2
+        and 6 in current_exempt_days
+        and 7 in current_exempt_days
+    )
+
+    return _build_exempt_days_keyboard(current_is_none, current_is_weekends, language, skip_callback)
+
+
+@lru_cache(maxsize=64)
+def _build_exempt_days_keyboard(
+    current_is_none: bool,
+    current_is_weekends: bool,
+    language: str,
+    skip_callback: str | None,
+) -> InlineKeyboardMarkup:
+    """Build the exempt days keyboard once per highlight state, language and skip callback."""
+    keyboard = []
 
     # None option
-    button_text = f"✓ {msg('BUTTON_EXEMPT_NONE', language)}" if current_is_none else msg('BUTTON_EXEMPT_NONE', language)
-    keyboard.append([
+    button_text = f"✓ {_m('BUTTON_EXEMPT_NONE', language)}" if current_is_none else _m('BUTTON_EXEMPT_NONE', language)
+    keyboard.append((
         InlineKeyboardButton(
             text=button_text,
             callback_data="exempt_days_none"
-        )
-    ])
+        ),
+    ))
 
     # Weekends option (Saturday=6, Sunday=7)
-    button_text = f"✓ {msg('BUTTON_EXEMPT_WEEKENDS', language)}" if current_is_weekends else msg('BUTTON_EXEMPT_WEEKENDS', language)
-    keyboard.append([
+    button_text = f"✓ {_m('BUTTON_EXEMPT_WEEKENDS', language)}" if current_is_weekends else _m('BUTTON_EXEMPT_WEEKENDS', language)
+    keyboard.append((
         InlineKeyboardButton(
             text=button_text,
             callback_data="exempt_days_weekends"
-        )
-    ])
-
-    # Add Skip button if requested
-    if skip_callback:
-        keyboard.append([
-            InlineKeyboardButton(
-                text=msg('BUTTON_SKIP', language),
-                callback_data=skip_callback
-            )
-        ])
+        ),
+    ))
 
-    # Add Cancel button
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_CANCEL', language),
-            callback_data="cancel_habit_flow"
-        )
-    ])
+    keyboard.extend(_habit_flow_tail_rows(language, skip_callback))
 
     return InlineKeyboardMarkup(keyboard)
 
@@ -1197,29 +1133,55 @@ def build_completion_date_options_keyboard(
         InlineKeyboardMarkup with date selection options
     """
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_TODAY', language),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_TODAY', language),
             callback_data=f"habit_{habit_id}_today"
-        )],
-        [InlineKeyboardButton(
-            text=msg('BUTTON_YESTERDAY', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_YESTERDAY', language),
             callback_data=f"habit_{habit_id}_yesterday"
-        )],
-        [InlineKeyboardButton(
-            text=msg('BUTTON_SELECT_DATE', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_SELECT_DATE', language),
             callback_data=f"backdate_habit_{habit_id}"
-        )],
-        [InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data="menu_back"
-        )]
+        ),),
+        (_back_button(language),)
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
+# Date picker buttons per row (8 days -> two rows)
+_DATE_PICKER_ROW_SIZE = 4
+# English month abbreviations for date picker labels, matching strftime("%b")
+# under the C locale without depending on the process locale
+_MONTH_ABBREVIATIONS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@lru_cache(maxsize=8)
+def _date_picker_days(today: date) -> tuple[tuple[date, str, str], ...]:
+    """
+    Return the date picker's days, oldest first, with their button labels.
+
+    The 8-day window only changes when the date does, so it is computed once
+    per distinct "today" (users in different timezones may differ by a day).
+
+    Args:
+        today: Today's date in the user's timezone
+
+    Returns:
+        Tuple of (date, "Nov 24"-style label, ISO date) triples for today and 7 days back
+    """
+    # Build 8 days (today and 7 days back), oldest to newest
+    dates = [today - timedelta(days=i) for i in range(7, -1, -1)]
+    return tuple(
+        (target_date, f"{_MONTH_ABBREVIATIONS[target_date.month - 1]} {target_date.day:02d}", target_date.isoformat())
+        for target_date in dates
+    )
+
+
 def build_date_picker_keyboard(
     habit_id: int | str,
-    completed_dates: list,  # list[date]
+    completed_dates: Iterable[date],
     language: str = 'en',
     user_today: date | None = None,
 ) -> InlineKeyboardMarkup:
@@ -1227,62 +1189,34 @@ def build_date_picker_keyboard(
 
     Args:
         habit_id: Habit primary key
-        completed_dates: List of dates that already have completions
+        completed_dates: Dates that already have completions (any iterable)
         language: Language code for translating Back button
         user_today: Today's date in user's timezone (defaults to UTC date.today())
 
     Returns:
         InlineKeyboardMarkup with 8-day calendar (today + 7 days back) and back button
     """
-    from datetime import timedelta
-
-    keyboard = []
     today = user_today if user_today is not None else date.today()
+    completed = set(completed_dates)
+    habit_part = f"{habit_id}_"
 
-    # Build 8 days (today and 7 days back)
-    dates = [today - timedelta(days=i) for i in range(8)]
-    dates.reverse()  # Oldest to newest
-
-    # Create rows of 4 buttons each
-    row = []
-    for target_date in dates:
-        # Check if this date already has a completion
-        is_completed = target_date in completed_dates
-
-        # Format button text
-        day_month = target_date.strftime("%b %d")  # e.g., "Nov 24"
-
-        if is_completed:
-            # Already completed - show checkmark, make it disabled/informational
-            button_text = f"{day_month} ✓"
-            callback_data = f"backdate_date_completed_{habit_id}_{target_date.isoformat()}"
-        else:
-            # Available for logging
-            button_text = day_month
-            callback_data = f"backdate_date_{habit_id}_{target_date.isoformat()}"
-
-        button = InlineKeyboardButton(
-            text=button_text,
-            callback_data=callback_data
+    buttons = [
+        # Already completed - show checkmark, make it disabled/informational
+        InlineKeyboardButton(
+            text=day_month + " ✓",
+            callback_data="backdate_date_completed_" + habit_part + iso_date
         )
-        row.append(button)
-
-        # Create rows of 4 buttons
-        if len(row) == 4:
-            keyboard.append(row)
-            row = []
+        if target_date in completed
+        # Available for logging
+        else InlineKeyboardButton(text=day_month, callback_data="backdate_date_" + habit_part + iso_date)
+        for target_date, day_month, iso_date in _date_picker_days(today)
+    ]
 
-    # Add remaining buttons
-    if row:
-        keyboard.append(row)
+    # Create rows of 4 buttons each
+    keyboard = [buttons[i:i + _DATE_PICKER_ROW_SIZE] for i in range(0, len(buttons), _DATE_PICKER_ROW_SIZE)]
 
     # Add Back button
-    keyboard.append([
-        InlineKeyboardButton(
-            text=msg('MENU_BACK', language),
-            callback_data="backdate_cancel"
-        )
-    ])
+    keyboard.append((_back_button(language, "backdate_cancel"),))
 
     return InlineKeyboardMarkup(keyboard)
 
@@ -1303,13 +1237,13 @@ def build_backdate_confirmation_keyboard(
         InlineKeyboardMarkup with Confirm/Cancel buttons
     """
     keyboard = [
-        [InlineKeyboardButton(
-            text=msg('BUTTON_YES', language),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_YES', language),
             callback_data=f"backdate_confirm_{habit_id}_{target_date.isoformat()}"
-        )],
-        [InlineKeyboardButton(
-            text=msg('BUTTON_NO', language),
+        ),),
+        (InlineKeyboardButton(
+            text=_m('BUTTON_NO', language),
             callback_data="backdate_cancel"
-        )]
+        ),)
     ]
     return InlineKeyboardMarkup(keyboard)
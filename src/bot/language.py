@@ -5,6 +5,8 @@ from telegram import Update
 from asgiref.sync import async_to_sync
 
 from src.config import settings
+from src.bot.messages import normalize_language
+from src.bot.user_cache import invalidate_user
 from src.core.repositories import user_repository as default_user_repository
 from src.utils.async_compat import maybe_await
 
@@ -22,15 +24,16 @@ def _resolve_user_repository():
     return getattr(bot_main, "user_repository", default_user_repository)
 
 
-def get_user_language(telegram_id: str) -> str:
-    """Fetch the persisted language for synchronous callers."""
+def _get_stored_language(telegram_id: str) -> str | None:
+    """Return the user's supported stored language, or None."""
     repo = _resolve_user_repository()
     user = async_to_sync(repo.get_by_telegram_id)(telegram_id)
-    if user and user.language:
-        lang = user.language.lower()[:2]
-        if lang in settings.supported_languages:
-            return lang
-    return settings.default_language
+    return normalize_language(user.language) if user else None
+
+
+def get_user_language(telegram_id: str) -> str:
+    """Fetch the persisted language for synchronous callers."""
+    return _get_stored_language(telegram_id) or settings.default_language
 
 
 def detect_language_from_telegram(update: Update) -> str:
@@ -44,31 +47,33 @@ def detect_language_from_telegram(update: Update) -> str:
         Language code detected from Telegram, or default language
     """
     if update and update.effective_user:
-        telegram_lang = update.effective_user.language_code
-        if telegram_lang:
-            # Normalize to 2-letter lowercase code
-            lang = telegram_lang.lower()[:2]
-            # Check if supported
-            if lang in settings.supported_languages:
-                return lang
+        lang = normalize_language(update.effective_user.language_code)
+        if lang:
+            return lang
     return settings.default_language
 
 
 def get_message_language(telegram_id: str, update: Update | None = None) -> str:
     """Synchronous helper that mirrors async language detection."""
-    repo = _resolve_user_repository()
-    user = async_to_sync(repo.get_by_telegram_id)(telegram_id)
-    if user and user.language:
-        lang = user.language.lower()[:2]
-        if lang in settings.supported_languages:
-            return lang
+    return _get_stored_language(telegram_id) or detect_language_from_telegram(update)
 
-    if update:
-        telegram_lang = detect_language_from_telegram(update)
-        if telegram_lang != settings.default_language:
-            return telegram_lang
 
-    return settings.default_language
+def get_message_language_for_user(user, update: Update | None = None) -> str:
+    """
+    Get language for message display from an already fetched user.
+
+    Lets handlers that load the user anyway skip a second repository lookup;
+    the fallback chain matches get_message_language_async.
+
+    Args:
+        user: User object, or None if the user was not found
+        update: Optional Telegram Update object
+
+    Returns:
+        Language code to use for messages
+    """
+    lang = normalize_language(user.language) if user else None
+    return lang or detect_language_from_telegram(update)
 
 
 async def get_message_language_async(telegram_id: str, update: Update | None = None) -> str:
@@ -90,19 +95,9 @@ async def get_message_language_async(telegram_id: str, update: Update | None = N
     # Try to get from user database (async)
     repo = _resolve_user_repository()
     user = await maybe_await(repo.get_by_telegram_id(telegram_id))
-    if user and user.language:
-        lang = user.language.lower()[:2]
-        if lang in settings.supported_languages:
-            return lang
-
-    # Try to detect from Telegram
-    if update:
-        telegram_lang = detect_language_from_telegram(update)
-        if telegram_lang != settings.default_language:
-            return telegram_lang
 
-    # Fallback to default
-    return settings.default_language
+    # Otherwise detect from Telegram, which falls back to the default
+    return get_message_language_for_user(user, update)
 
 
 async def set_user_language(telegram_id: str, language_code: str) -> bool:
@@ -122,8 +117,8 @@ async def set_user_language(telegram_id: str, language_code: str) -> bool:
         return False
 
     # Normalize and validate language code
-    lang = language_code.lower()[:2]
-    if lang not in settings.supported_languages:
+    lang = normalize_language(language_code)
+    if not lang:
         logger.warning(
             "Unsupported language '%s' provided for user %s", language_code, telegram_id
         )
@@ -136,6 +131,7 @@ async def set_user_language(telegram_id: str, language_code: str) -> bool:
     try:
         await maybe_await(repo.update(user.id, {"language": lang}))
         logger.info("Updated language for user %s to %s", telegram_id, lang)
+        invalidate_user(telegram_id)
         return True
     except Exception as exc:
         logger.error("Failed to update language for user %s: %s", telegram_id, exc)
@@ -3,42 +3,47 @@
 
 import os
 import django
+from django.apps import apps
 
-# Configure Django before any imports that use Django models
+# Configure Django before any imports that use Django models. Skip when the
+# app registry is already populated (tests, management commands) so setup and
+# AppConfig.ready() don't run twice.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'src.habit_reward_project.settings')
-django.setup()
+if not apps.ready:
+    django.setup()
 
 import logging
-from telegram import Update
-from telegram.ext import Application, CommandHandler
+from telegram.ext import Application
 from src.utils.logging import setup_logging
 from src.bot.message_utils import cancel_pending_deletions
-from src.bot.handlers.command_handlers import start_command, help_command
-from src.bot.handlers.habit_done_handler import habit_done_conversation
-from src.bot.handlers.habit_revert_handler import habit_revert_conversation
-from src.bot.handlers.backdate_handler import backdate_conversation
-from src.bot.handlers.habit_management_handler import (
-    add_habit_conversation,
-    edit_habit_conversation,
-    remove_habit_conversation
-)
-from src.bot.handlers.reward_handlers import (
-    list_rewards_command,
-    my_rewards_command,
-    claimed_rewards_command,
-    claim_reward_conversation,
-    add_reward_conversation,
-    edit_reward_conversation,
-    toggle_reward_conversation,
-)
-from src.bot.handlers.streak_handler import streaks_command
-from src.bot.handlers.menu_handler import get_menu_handlers
-from src.bot.handlers.settings_handler import settings_conversation
+from src.bot.updates import ALLOWED_UPDATES
+from src.bot.handlers.registry import get_handler_groups
 
 # Configure logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# /start and /help keep no conversation state, so in polling mode they run as
+# tasks (block=False) and the loop moves on to the next update while they wait
+# on the database. Webhook mode keeps every handler blocking.
+NON_BLOCKING_COMMANDS = ("start", "help")
+
+# HTTPX pool for Bot API calls made by handlers. Concurrent handlers each hold
+# a connection while replying, so size the pool well above typical bursts and
+# wait for a free slot instead of failing immediately.
+CONNECTION_POOL_SIZE = 256
+POOL_TIMEOUT = 30.0
+CONNECT_TIMEOUT = 10.0
+READ_TIMEOUT = 20.0
+# getUpdates uses its own pool; polling keeps a single long-poll open.
+GET_UPDATES_CONNECTION_POOL_SIZE = 16
+GET_UPDATES_POOL_TIMEOUT = 30.0
+# Seconds Telegram holds each getUpdates open waiting for updates; PTB adds
+# this to the read timeout. A longer poll means fewer empty round-trips.
+LONG_POLL_TIMEOUT = 50
+# Retry startup (deleteWebhook/getMe) until the network is reachable.
+BOOTSTRAP_RETRIES = -1
+
 
 async def _cancel_pending_message_deletions(application: Application) -> None:
     """Cancel fire-and-forget message cleanup tasks during application shutdown."""
@@ -53,64 +58,44 @@ def main():
     Note: In production, use webhook mode via Django ASGI server.
     This polling mode is kept for local development without webhooks.
     """
-    # Initialize Django for development mode
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'src.habit_reward_project.settings')
-    import django
-    django.setup()
-
-    # Import settings after Django setup
+    # Django is configured at import time above
     from django.conf import settings
 
+    # run_polling() deletes any registered webhook, which would silently cut
+    # off the production ASGI deployment. Polling is for local development
+    # only, so refuse to start while a webhook URL is configured.
+    if settings.TELEGRAM_WEBHOOK_URL:
+        logger.error(
+            "❌ TELEGRAM_WEBHOOK_URL is set; not starting polling. "
+            "Serve the webhook with: uvicorn src.habit_reward_project.asgi:application"
+        )
+        return
+
     # Create application
     application = (
         Application.builder()
         .token(settings.TELEGRAM_BOT_TOKEN)
+        .connection_pool_size(CONNECTION_POOL_SIZE)
+        .pool_timeout(POOL_TIMEOUT)
+        .connect_timeout(CONNECT_TIMEOUT)
+        .read_timeout(READ_TIMEOUT)
+        .get_updates_connection_pool_size(GET_UPDATES_CONNECTION_POOL_SIZE)
+        .get_updates_pool_timeout(GET_UPDATES_POOL_TIMEOUT)
         .post_shutdown(_cancel_pending_message_deletions)
         .build()
     )
 
-    # Add handlers
-    application.add_handler(CommandHandler("start", start_command))
-    application.add_handler(CommandHandler("help", help_command))
-
-    # Add conversation handler for habit_done
-    application.add_handler(habit_done_conversation)
-    application.add_handler(habit_revert_conversation)
-    application.add_handler(backdate_conversation)
-
-    # Add habit management conversation handlers
-    application.add_handler(add_habit_conversation)
-    application.add_handler(edit_habit_conversation)
-    application.add_handler(remove_habit_conversation)
-
-    # Add reward handlers
-    application.add_handler(CommandHandler("list_rewards", list_rewards_command))
-    application.add_handler(CommandHandler("my_rewards", my_rewards_command))
-    application.add_handler(CommandHandler("claimed_rewards", claimed_rewards_command))
-    application.add_handler(claim_reward_conversation)
-    application.add_handler(add_reward_conversation)
-    application.add_handler(edit_reward_conversation)
-    application.add_handler(toggle_reward_conversation)
-
-    # Add streak handler
-    application.add_handler(CommandHandler("streaks", streaks_command))
-
-    # Add settings handler
-    application.add_handler(settings_conversation)
-
-    # Register web login callback handler in group 1
-    from src.bot.handlers.web_login_handler import web_login_handler
-    application.add_handler(web_login_handler, group=1)
-
-    # Register menu callbacks in group 1 (after conversation handlers in group 0)
-    # This ensures conversation handlers take precedence when active
-    for handler in get_menu_handlers():
-        application.add_handler(handler, group=1)
+    # Same handler table as the webhook deployment
+    application.add_handlers(get_handler_groups(NON_BLOCKING_COMMANDS))
 
     # Start the bot in polling mode (development)
     logger.info("🤖 Running bot in POLLING mode (development)")
     logger.info("ℹ️ For production, use: uvicorn src.habit_reward_project.asgi:application")
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    application.run_polling(
+        timeout=LONG_POLL_TIMEOUT,
+        bootstrap_retries=BOOTSTRAP_RETRIES,
+        allowed_updates=ALLOWED_UPDATES,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,8 @@
+"""Update types requested from Telegram."""
+
+from telegram import Update
+
+# Update kinds the handlers consume: commands and text replies (including
+# edits, which MessageHandler/CommandHandler also accept) and inline buttons.
+# Telegram omits everything else from getUpdates and webhook deliveries.
+ALLOWED_UPDATES = [Update.MESSAGE, Update.EDITED_MESSAGE, Update.CALLBACK_QUERY]
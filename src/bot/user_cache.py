@@ -0,0 +1,78 @@
+"""Short-lived cache of users looked up by Telegram ID.
+
+/start and /help only need a user's language and active flag, so they read the
+user through this cache instead of querying the repository on every command.
+Code that changes those fields for a Telegram user (the bot's settings, the
+web API and the Django admin) calls invalidate_user(), so deactivating a user
+locks them out at once. Expired entries are dropped on their next lookup, and
+both caches are capped so IDs seen once do not pile up.
+
+Unknown Telegram IDs are remembered for a shorter time, so repeated /start from
+unregistered accounts is answered without a query each time. Registering a
+user in the admin clears that entry; users created elsewhere can use the bot
+once it expires.
+"""
+
+import time
+
+from src.utils.async_compat import maybe_await
+
+USER_CACHE_TTL = 60.0
+USER_CACHE_SIZE = 10_000
+# Keyed by the numeric Telegram ID as PTB delivers it (effective_user.id), so
+# cache hits skip the str() the repository needs. Like _missing_users below,
+# entries are inserted with a fixed TTL, so the first entry is the oldest.
+_user_cache: dict[int, tuple[object, float]] = {}
+
+MISSING_USER_TTL = 30.0
+MISSING_USER_CACHE_SIZE = 10_000
+# Telegram ID -> expiry for IDs with no user. Entries are inserted with a
+# fixed TTL, so insertion order is expiry order and the first entry is the
+# one to evict when the cache is full.
+_missing_users: dict[int, float] = {}
+
+
+async def get_user_by_telegram_id(user_repository, telegram_id: int):
+    """Return the user for a Telegram ID, from the cache when fresh.
+
+    Args:
+        user_repository: Repository used on a cache miss
+        telegram_id: Numeric Telegram user ID
+
+    Returns:
+        User object, or None if the user does not exist
+    """
+    now = time.monotonic()
+    cached = _user_cache.get(telegram_id)
+    if cached is not None:
+        if cached[1] > now:
+            return cached[0]
+        del _user_cache[telegram_id]
+
+    missing_until = _missing_users.get(telegram_id)
+    if missing_until is not None:
+        if missing_until > now:
+            return None
+        # Expired: drop it so a re-insert goes to the end and keeps the order
+        del _missing_users[telegram_id]
+
+    user = await maybe_await(user_repository.get_by_telegram_id(str(telegram_id)))
+    if user:
+        if len(_user_cache) >= USER_CACHE_SIZE:
+            del _user_cache[next(iter(_user_cache))]
+        _user_cache[telegram_id] = (user, now + USER_CACHE_TTL)
+    else:
+        if len(_missing_users) >= MISSING_USER_CACHE_SIZE:
+            del _missing_users[next(iter(_missing_users))]
+        _missing_users[telegram_id] = now + MISSING_USER_TTL
+    return user
+
+
+def invalidate_user(telegram_id: int | str) -> None:
+    """Drop a cached user, or cached absence, after its data changes."""
+    try:
+        telegram_id = int(telegram_id)
+    except ValueError:
+        return  # Not a Telegram ID the bot could have cached
+    _user_cache.pop(telegram_id, None)
+    _missing_users.pop(telegram_id, None)
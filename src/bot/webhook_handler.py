@@ -41,79 +41,26 @@ def setup_handlers_sync():
     """
     logger.info("🔧 Registering Telegram bot handlers...")
 
-    # Import all handlers
-    from telegram.ext import CommandHandler
-    from src.bot.handlers.command_handlers import start_command, help_command
-    from src.bot.handlers.habit_done_handler import habit_done_conversation
-    from src.bot.handlers.habit_revert_handler import habit_revert_conversation
-    from src.bot.handlers.backdate_handler import backdate_conversation
-    from src.bot.handlers.habit_management_handler import (
-        add_habit_conversation,
-        edit_habit_conversation,
-        remove_habit_conversation
-    )
-    from src.bot.handlers.reward_handlers import (
-        list_rewards_command,
-        my_rewards_command,
-        claimed_rewards_command,
-        claim_reward_conversation,
-        add_reward_conversation,
-        edit_reward_conversation,
-        toggle_reward_conversation,
-    )
-    from src.bot.handlers.streak_handler import streaks_command
-    from src.bot.handlers.settings_handler import settings_conversation
-    from src.bot.handlers.menu_handler import get_menu_handlers
-
-    # Register command handlers
-    application.add_handler(CommandHandler("start", start_command))
-    application.add_handler(CommandHandler("help", help_command))
-
-    # Add conversation handler for habit_done
-    application.add_handler(habit_done_conversation)
-    application.add_handler(habit_revert_conversation)
-    application.add_handler(backdate_conversation)
-
-    # Add habit management conversation handlers
-    application.add_handler(add_habit_conversation)
-    application.add_handler(edit_habit_conversation)
-    application.add_handler(remove_habit_conversation)
-
-    # Add reward handlers
-    application.add_handler(CommandHandler("list_rewards", list_rewards_command))
-    application.add_handler(CommandHandler("my_rewards", my_rewards_command))
-    application.add_handler(CommandHandler("claimed_rewards", claimed_rewards_command))
-    application.add_handler(claim_reward_conversation)
-    application.add_handler(add_reward_conversation)
-    application.add_handler(edit_reward_conversation)
-    application.add_handler(toggle_reward_conversation)
-
-    # Add streak handler
-    application.add_handler(CommandHandler("streaks", streaks_command))
-
-    # Add settings handler
-    application.add_handler(settings_conversation)
-
-    # Register web login callback handler in group 1
-    from src.bot.handlers.web_login_handler import web_login_handler
-    application.add_handler(web_login_handler, group=1)
-
-    # Register menu callbacks in group 1 so they run alongside ConversationHandlers
-    # (ConversationHandlers in group 0 end conversations; group 1 handles navigation)
-    for handler in get_menu_handlers():
-        application.add_handler(handler, group=1)
-
-    # DEBUG: Add catch-all callback handler to log all callbacks
-    from telegram.ext import CallbackQueryHandler
-    async def debug_all_callbacks(update: Update, context):
-        query = update.callback_query
-        user_id = update.effective_user.id
-        logger.debug(f"🟢 GLOBAL DEBUG: Callback received - user: {user_id}, data: {query.data}")
-        # Don't answer, let other handlers process it
-        return None
-
-    # Add as lowest priority (catches what others miss)
-    application.add_handler(CallbackQueryHandler(debug_all_callbacks), group=999)
+    from src.bot.handlers.registry import get_handler_groups
+
+    # All handlers block: the application is never started in webhook mode
+    application.add_handlers(get_handler_groups())
+
+    # DEBUG: Add catch-all callback handler to log all callbacks. Only
+    # registered when debug logging is on, since it runs for every callback.
+    if logger.isEnabledFor(logging.DEBUG):
+        from telegram.ext import CallbackQueryHandler
+
+        async def debug_all_callbacks(update: Update, context):
+            logger.debug(
+                "🟢 GLOBAL DEBUG: Callback received - user: %s, data: %s",
+                update.effective_user.id, update.callback_query.data,
+            )
+            # Don't answer, let other handlers process it
+            return None
+
+        # Add as lowest priority (catches what others miss)
+        application.add_handler(CallbackQueryHandler(debug_all_callbacks), group=999)
 
     logger.info("✅ All Telegram handlers registered")
 
@@ -155,7 +102,7 @@ async def telegram_webhook(request):
         HttpResponse with 'ok' on success, HttpResponseBadRequest on error
     """
     if request.method != 'POST':
-        logger.warning(f"⚠️ Received {request.method} request to webhook endpoint")
+        logger.warning("⚠️ Received %s request to webhook endpoint", request.method)
         return HttpResponseBadRequest('Only POST requests are allowed')
 
     try:
@@ -164,7 +111,7 @@ async def telegram_webhook(request):
 
         # Parse update from request body
         update_data = json.loads(request.body)
-        logger.debug(f"📨 Received webhook update: {update_data.get('update_id', 'unknown')}")
+        logger.debug("📨 Received webhook update: %s", update_data.get('update_id', 'unknown'))
 
         update = Update.de_json(update_data, application.bot)
 
@@ -174,8 +121,8 @@ async def telegram_webhook(request):
         return HttpResponse('ok')
 
     except json.JSONDecodeError as e:
-        logger.error(f"❌ JSON decode error in webhook: {e}")
+        logger.error("❌ JSON decode error in webhook: %s", e)
         return HttpResponseBadRequest(f'Invalid JSON: {e}')
     except Exception as e:
-        logger.error(f"❌ Error processing webhook: {e}", exc_info=True)
+        logger.error("❌ Error processing webhook: %s", e, exc_info=True)
         return HttpResponseBadRequest(str(e))
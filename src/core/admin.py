@@ -6,6 +6,7 @@ from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.db import transaction
 from django.db.models import F
 from src.core.models import User, Habit, Reward, RewardProgress, HabitLog, BotAuditLog, APIKey
+from src.bot.user_cache import invalidate_user
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,17 @@ class UserAdmin(BaseUserAdmin):
         }),
     )
 
+    def save_model(self, request, obj, form, change):
+        """Save the user and drop the bot's cached copy of it.
+
+        The bot caches users' language and active flag (and unknown Telegram
+        IDs), so invalidating here makes deactivation, language changes and new
+        registrations take effect at once.
+        """
+        super().save_model(request, obj, form, change)
+        if obj.telegram_id and (not change or {'is_active', 'language'} & set(form.changed_data)):
+            invalidate_user(obj.telegram_id)
+
 
 @admin.register(Habit)
 class HabitAdmin(admin.ModelAdmin):
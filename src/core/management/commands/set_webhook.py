@@ -5,6 +5,8 @@ from django.core.management.base import BaseCommand
 from django.conf import settings
 import telegram
 
+from src.bot.updates import ALLOWED_UPDATES
+
 
 class Command(BaseCommand):
     """Set Telegram webhook URL for production deployment."""
@@ -27,8 +29,8 @@ class Command(BaseCommand):
 
         self.stdout.write(f'Setting webhook to: {webhook_url}')
 
-        # Set webhook
-        await bot.set_webhook(url=webhook_url)
+        # Set webhook, limited to the update types the handlers consume
+        await bot.set_webhook(url=webhook_url, allowed_updates=ALLOWED_UPDATES)
 
         # Verify
         webhook_info = await bot.get_webhook_info()
@@ -56,6 +56,30 @@ class TestUpdateCurrentUser:
         assert data["language"] == "ru"
         mock_repo.update.assert_called_once_with(mock_user.id, {"language": "ru"})
 
+    @patch("src.api.v1.routers.users.invalidate_user")
+    @patch("src.api.v1.routers.users.user_repository")
+    def test_update_user_language_invalidates_bot_cache(
+        self, mock_repo, mock_invalidate, client, mock_user
+    ):
+        """Test that a language change drops the bot's cached user."""
+        mock_repo.update = AsyncMock(return_value=mock_user)
+
+        client.patch("/v1/users/me", json={"language": "ru"})
+
+        mock_invalidate.assert_called_once_with(mock_user.telegram_id)
+
+    @patch("src.api.v1.routers.users.invalidate_user")
+    @patch("src.api.v1.routers.users.user_repository")
+    def test_update_user_name_keeps_bot_cache(
+        self, mock_repo, mock_invalidate, client, mock_user
+    ):
+        """Test that changes the bot does not cache leave it alone."""
+        mock_repo.update = AsyncMock(return_value=mock_user)
+
+        client.patch("/v1/users/me", json={"name": "New Name"})
+
+        mock_invalidate.assert_not_called()
+
     @patch("src.api.v1.routers.users.user_repository")
     def test_update_user_multiple_fields(self, mock_repo, client, mock_user):
         """Test updating multiple user fields at once."""
@@ -0,0 +1,312 @@
+"""Tests for inline keyboard builders."""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from src.bot.keyboards import (
+    build_actionable_rewards_keyboard,
+    build_category_selection_keyboard,
+    build_claimable_rewards_keyboard,
+    build_date_picker_keyboard,
+    build_exempt_days_keyboard,
+    build_grace_days_keyboard,
+    build_habit_confirmation_keyboard,
+    build_habit_revert_keyboard,
+    build_habit_selection_keyboard,
+    build_habits_for_edit_keyboard,
+    build_no_reward_probability_keyboard,
+    build_reward_edit_recurring_keyboard,
+    build_reward_edit_weight_keyboard,
+    build_reward_weight_keyboard,
+    build_rewards_for_toggle_keyboard,
+    build_simple_habit_selection_keyboard,
+    build_skip_cancel_keyboard,
+    build_start_menu_keyboard,
+    build_weight_selection_keyboard,
+)
+from src.bot.messages import msg
+from src.config import HABIT_CATEGORIES, settings
+from src.models.habit import Habit
+from src.models.reward import Reward
+from src.models.reward_progress import RewardProgress
+
+
+@pytest.fixture(params=settings.supported_languages)
+def language(request):
+    """Parameterized fixture for testing all supported languages."""
+    return request.param
+
+
+def _texts(markup):
+    return [btn.text for row in markup.inline_keyboard for btn in row]
+
+
+def _callbacks(markup):
+    return [btn.callback_data for row in markup.inline_keyboard for btn in row]
+
+
+class TestHabitListKeyboards:
+    """Tests for the habit list keyboards sharing one builder."""
+
+    HABITS = [Habit(id="h1", name="Walking", weight=0), Habit(id="h2", name="Reading", weight=0)]
+
+    @pytest.mark.parametrize("builder, prefix", [
+        (build_habit_selection_keyboard, "habit_"),
+        (build_simple_habit_selection_keyboard, "simple_habit_"),
+        (build_habit_revert_keyboard, "revert_habit_"),
+    ])
+    def test_callback_prefix_and_back_button(self, language, builder, prefix):
+        markup = builder(self.HABITS, language)
+
+        assert _texts(markup) == ["Walking", "Reading", msg('MENU_BACK', language)]
+        assert _callbacks(markup) == [f"{prefix}h1", f"{prefix}h2", "menu_back"]
+
+    @pytest.mark.parametrize("operation, prefix, back", [
+        ("edit", "edit_habit_", "edit_back"),
+        ("remove", "remove_habit_", "remove_back"),
+    ])
+    def test_habits_for_edit_operations(self, operation, prefix, back):
+        markup = build_habits_for_edit_keyboard(self.HABITS, operation)
+
+        assert _callbacks(markup) == [f"{prefix}h1", f"{prefix}h2", back]
+
+
+class TestCategorySelectionKeyboard:
+    """Tests for build_category_selection_keyboard()."""
+
+    def test_no_highlight_lists_all_categories(self, language):
+        markup = build_category_selection_keyboard(language=language)
+
+        assert _callbacks(markup) == [
+            f"category_{category_id}" for category_id, _ in HABIT_CATEGORIES
+        ] + ["cancel_habit_flow"]
+        assert not any(text.startswith("✓") for text in _texts(markup))
+        assert _texts(markup)[-1] == msg('MENU_CANCEL', language)
+
+    def test_highlight_marks_only_current_category(self):
+        category_id, category_display = HABIT_CATEGORIES[2]
+
+        markup = build_category_selection_keyboard(current_category=category_id)
+
+        texts = _texts(markup)
+        assert texts[2] == f"✓ {category_display}"
+        assert [t for t in texts if t.startswith("✓")] == [texts[2]]
+
+    def test_highlight_does_not_leak_into_later_builds(self):
+        category_id, _ = HABIT_CATEGORIES[0]
+        build_category_selection_keyboard(current_category=category_id)
+
+        markup = build_category_selection_keyboard()
+
+        assert not any(text.startswith("✓") for text in _texts(markup))
+
+    def test_skip_button_before_cancel(self, language):
+        markup = build_category_selection_keyboard(language=language, skip_callback="skip_category")
+
+        assert _callbacks(markup)[-2:] == ["skip_category", "cancel_habit_flow"]
+
+
+class TestStaticKeyboardCache:
+    """Language-only keyboards are built once per language and reused."""
+
+    def test_same_language_returns_cached_markup(self, language):
+        assert build_start_menu_keyboard(language) is build_start_menu_keyboard(language)
+
+    def test_languages_do_not_share_markup(self):
+        assert build_start_menu_keyboard('en') is not build_start_menu_keyboard('ru')
+        assert build_start_menu_keyboard('ru').inline_keyboard[0][0].text == msg('BUTTON_HABIT_DONE', 'ru')
+
+    def test_precomputed_labels_match_messages(self, language):
+        markup = build_skip_cancel_keyboard(language)
+
+        assert _texts(markup) == [msg('BUTTON_SKIP', language), msg('MENU_CANCEL', language)]
+
+    def test_unsupported_language_falls_back_to_messages(self):
+        assert _texts(build_skip_cancel_keyboard('de')) == _texts(build_skip_cancel_keyboard('en'))
+
+    def test_probability_keyboard_is_cached_per_language_only(self):
+        markup = build_no_reward_probability_keyboard(25.0, 'en')
+
+        assert build_no_reward_probability_keyboard(60.5, 'en') is markup
+        assert build_no_reward_probability_keyboard(25.0, 'ru') is not markup
+
+
+class TestRewardWeightKeyboards:
+    """Tests for the reward weight preset keyboards."""
+
+    def test_create_flow_presets(self):
+        markup = build_reward_weight_keyboard('en')
+
+        assert [len(row) for row in markup.inline_keyboard] == [3, 3, 3, 1, 1]
+        assert _callbacks(markup)[:10] == [f"reward_weight_{w}" for w in range(10, 101, 10)]
+
+    def test_edit_flow_highlights_current_weight(self):
+        markup = build_reward_edit_weight_keyboard(current_weight=40.0)
+
+        texts = _texts(markup)
+        assert texts[3] == "✓ 40"
+        assert [t for t in texts if t.startswith("✓")] == ["✓ 40"]
+        assert _callbacks(markup)[3] == "edit_reward_weight_40"
+
+    @pytest.mark.parametrize("current_weight", ["abc", object(), 45])
+    def test_edit_flow_ignores_unmatched_weight(self, current_weight):
+        markup = build_reward_edit_weight_keyboard(current_weight=current_weight)
+
+        assert not any(text.startswith("✓") for text in _texts(markup))
+
+    def test_edit_flow_highlight_does_not_leak(self):
+        build_reward_edit_weight_keyboard(current_weight=10)
+
+        markup = build_reward_edit_weight_keyboard()
+
+        assert not any(text.startswith("✓") for text in _texts(markup))
+        assert _callbacks(markup)[-2:] == ["edit_reward_weight_skip", "cancel_reward_flow"]
+
+
+class TestRewardToggleKeyboard:
+    """Tests for build_rewards_for_toggle_keyboard()."""
+
+    def test_status_and_recurring_indicators(self):
+        rewards = [
+            SimpleNamespace(id="r1", name="Coffee", active=True, is_recurring=True),
+            SimpleNamespace(id="r2", name="Movie", active=False, is_recurring=False),
+        ]
+
+        markup = build_rewards_for_toggle_keyboard(rewards)
+
+        assert _texts(markup)[:2] == ["✅ Coffee (🔄)", "❌ Movie (🔒)"]
+        assert _callbacks(markup) == ["toggle_reward_r1", "toggle_reward_r2", "reward_toggle_back"]
+
+
+class TestClaimKeyboards:
+    """Tests for the reward claim keyboards."""
+
+    def test_actionable_rewards_button_text(self):
+        progress = RewardProgress(user_id=1, reward_id=7, pieces_earned=3, pieces_required=3)
+
+        markup = build_actionable_rewards_keyboard([progress])
+
+        assert _texts(markup) == ["✅ Claim: 3/3 pieces"]
+        assert _callbacks(markup) == ["claim_reward_7"]
+
+    def test_claimable_rewards_button_text(self, language):
+        progress = RewardProgress(user_id=1, reward_id=7, pieces_earned=2, pieces_required=2)
+        rewards = {7: Reward(id=7, name="Coffee", pieces_required=2)}
+
+        markup = build_claimable_rewards_keyboard([progress], rewards, language)
+
+        assert _texts(markup) == ["Coffee (2/2)", msg('MENU_BACK', language)]
+        assert _callbacks(markup) == ["claim_reward_7", "claim_reward_back"]
+
+
+class TestRewardEditRecurringKeyboard:
+    """Tests for build_reward_edit_recurring_keyboard()."""
+
+    @pytest.mark.parametrize("current, checked", [(True, 0), (False, 1)])
+    def test_highlights_current_choice(self, language, current, checked):
+        markup = build_reward_edit_recurring_keyboard(current_is_recurring=current, language=language)
+
+        texts = _texts(markup)
+        keys = ('BUTTON_RECURRING_YES', 'BUTTON_RECURRING_NO')
+        assert texts[checked] == f"✓ {msg(keys[checked], language)}"
+        assert texts[1 - checked] == msg(keys[1 - checked], language)
+
+    def test_truthy_non_bool_is_not_highlighted(self):
+        build_reward_edit_recurring_keyboard(current_is_recurring=True)
+
+        markup = build_reward_edit_recurring_keyboard(current_is_recurring=1)
+
+        assert not any(text.startswith("✓") for text in _texts(markup))
+
+
+class TestNumericPresetKeyboards:
+    """Tests for the habit weight and grace days keyboards."""
+
+    def test_weight_keyboard_highlights_current(self):
+        markup = build_weight_selection_keyboard(current_weight=15)
+
+        texts = _texts(markup)
+        assert texts[:7] == ["0", "5", "10", "✓ 15", "20", "25", "30"]
+        assert [len(row) for row in markup.inline_keyboard][:2] == [4, 3]
+        assert _callbacks(markup)[3] == "weight_15"
+
+    def test_grace_days_keyboard_highlights_current(self):
+        markup = build_grace_days_keyboard(current_grace_days=0)
+
+        assert _texts(markup)[:4] == ["✓ 0", "1", "2", "3"]
+        assert _callbacks(markup)[:4] == [f"grace_days_{d}" for d in range(4)]
+
+    @pytest.mark.parametrize("current", [None, 7])
+    def test_grace_days_keyboard_without_highlight(self, current):
+        markup = build_grace_days_keyboard(current_grace_days=current)
+
+        assert _texts(markup)[:4] == ["0", "1", "2", "3"]
+
+    def test_grace_days_keyboard_is_cached_per_arguments(self):
+        markup = build_grace_days_keyboard(1, 'en', 'skip_grace')
+
+        assert build_grace_days_keyboard(1, 'en', 'skip_grace') is markup
+        assert build_grace_days_keyboard(2, 'en', 'skip_grace') is not markup
+
+
+class TestExemptDaysKeyboard:
+    """Tests for build_exempt_days_keyboard()."""
+
+    @pytest.mark.parametrize("current, checked", [
+        (None, 0), ([], 0), ([7, 6], 1), ([6, 6], None), ([1, 6, 7], None),
+    ])
+    def test_highlights_current_option(self, language, current, checked):
+        markup = build_exempt_days_keyboard(current, language)
+
+        texts = _texts(markup)[:2]
+        assert [i for i, text in enumerate(texts) if text.startswith("✓")] == ([] if checked is None else [checked])
+
+    def test_list_argument_reuses_cached_markup(self):
+        assert build_exempt_days_keyboard([6, 7]) is build_exempt_days_keyboard([7, 6])
+
+
+class TestPrebuiltKeyboards:
+    """Confirm/Yes-No keyboards are built once per language and reused."""
+
+    def test_supported_language_returns_prebuilt_markup(self, language):
+        markup = build_habit_confirmation_keyboard(language)
+
+        assert markup is build_habit_confirmation_keyboard(language)
+        assert _texts(markup) == [
+            msg('BUTTON_YES', language), msg('BUTTON_NO', language), msg('MENU_CANCEL', language)
+        ]
+
+    def test_other_language_code_is_built_on_demand(self):
+        markup = build_habit_confirmation_keyboard('RU')
+
+        assert _texts(markup) == _texts(build_habit_confirmation_keyboard('ru'))
+
+
+class TestDatePickerKeyboard:
+    """Tests for build_date_picker_keyboard()."""
+
+    TODAY = date(2025, 3, 2)
+
+    def test_eight_days_oldest_first(self, language):
+        markup = build_date_picker_keyboard(42, [], language, user_today=self.TODAY)
+
+        assert [len(row) for row in markup.inline_keyboard] == [4, 4, 1]
+        assert _texts(markup)[:8] == [
+            "Feb 23", "Feb 24", "Feb 25", "Feb 26", "Feb 27", "Feb 28", "Mar 01", "Mar 02"
+        ]
+        assert _callbacks(markup)[7] == "backdate_date_42_2025-03-02"
+        assert _callbacks(markup)[-1] == "backdate_cancel"
+
+    @pytest.mark.parametrize("container", [list, set, iter])
+    def test_completed_dates_are_marked(self, container):
+        completed = container([date(2025, 2, 28), date(2025, 3, 2)])
+
+        markup = build_date_picker_keyboard("42", completed, user_today=self.TODAY)
+
+        texts, callbacks = _texts(markup), _callbacks(markup)
+        assert texts[5] == "Feb 28 ✓"
+        assert callbacks[5] == "backdate_date_completed_42_2025-02-28"
+        assert texts[6] == "Mar 01"
+        assert texts[7] == "Mar 02 ✓"
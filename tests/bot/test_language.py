@@ -0,0 +1,95 @@
+"""Tests for language detection and storage helpers."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.bot import language, messages
+
+
+def _repo(user):
+    repo = Mock()
+    repo.get_by_telegram_id = AsyncMock(return_value=user)
+    repo.update = AsyncMock()
+    return repo
+
+
+class TestStoredLanguage:
+    """Synchronous lookups read the stored language from the repository."""
+
+    @pytest.mark.parametrize("stored, expected", [("ru", "ru"), ("de", "en"), (None, "en")])
+    def test_get_user_language(self, stored, expected):
+        repo = _repo(SimpleNamespace(id=1, language=stored))
+
+        with patch("src.bot.language._resolve_user_repository", return_value=repo):
+            assert language.get_user_language("123") == expected
+
+    def test_unknown_user_uses_default(self):
+        with patch("src.bot.language._resolve_user_repository", return_value=_repo(None)):
+            assert language.get_user_language("123") == "en"
+
+    @pytest.mark.asyncio
+    async def test_set_user_language_persists_code(self):
+        repo = _repo(SimpleNamespace(id=1, language="en"))
+
+        with patch("src.bot.language._resolve_user_repository", return_value=repo):
+            assert await language.set_user_language("123", "kk") is True
+
+        repo.update.assert_awaited_once_with(1, {"language": "kk"})
+
+
+class TestLanguageNormalization:
+    """Normalized language codes are validated and shared."""
+
+    def test_detected_code_is_shared_instance(self):
+        update = SimpleNamespace(effective_user=SimpleNamespace(language_code="ru-RU"))
+
+        lang = language.detect_language_from_telegram(update)
+
+        assert lang == "ru"
+        assert lang is messages._SUPPORTED_LANGUAGES["ru"]
+
+    def test_unsupported_code_falls_back_to_default(self):
+        update = SimpleNamespace(effective_user=SimpleNamespace(language_code="de"))
+
+        assert language.detect_language_from_telegram(update) == "en"
+
+    @pytest.mark.parametrize("code, expected", [
+        ("kk", "kk"), ("KK", "kk"), ("en-US", "en"), ("de", None), ("", None), (None, None),
+    ])
+    def test_normalize_language(self, code, expected):
+        assert language.normalize_language(code) == expected
+
+    def test_normalize_language_is_cached_by_code(self):
+        language.normalize_language.cache_clear()
+
+        language.normalize_language("ru-RU")
+        language.normalize_language("ru-RU")
+
+        info = language.normalize_language.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestMessageLanguageFallback:
+    """get_message_language(_async) prefer stored, then Telegram, then default."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stored, telegram_code, expected", [
+        ("kk", "ru", "kk"),
+        (None, "ru", "ru"),
+        ("de", "ru-RU", "ru"),
+        (None, None, "en"),
+    ])
+    async def test_fallback_chain(self, stored, telegram_code, expected):
+        repo = _repo(SimpleNamespace(id=1, language=stored))
+        update = SimpleNamespace(effective_user=SimpleNamespace(language_code=telegram_code))
+
+        with patch("src.bot.language._resolve_user_repository", return_value=repo):
+            assert await language.get_message_language_async("123", update) == expected
+
+    def test_sync_without_update_uses_default(self):
+        repo = _repo(None)
+
+        with patch("src.bot.language._resolve_user_repository", return_value=repo):
+            assert language.get_message_language("123") == "en"
@@ -0,0 +1,120 @@
+"""Tests for message lookup and translation fallback."""
+
+import pytest
+
+from src.bot import messages
+from src.bot.messages import MESSAGES_EN, Messages, msg
+
+
+class TestMessageLookup:
+    """Tests for msg() / Messages.get()."""
+
+    def test_english_uses_class_constant(self):
+        assert msg('MENU_BACK', 'en') == Messages.MENU_BACK
+
+    def test_class_attributes_read_english_table(self):
+        assert Messages.ERROR_GENERAL is MESSAGES_EN['ERROR_GENERAL']
+        with pytest.raises(AttributeError):
+            Messages.NO_SUCH_KEY
+
+    def test_translated_message(self):
+        assert msg('MENU_BACK', 'ru') == messages._load_translations('ru')['MENU_BACK']
+
+    def test_missing_translation_falls_back_to_english(self):
+        # AUTH_CODE_* strings are only defined in English
+        assert 'AUTH_CODE_EXPIRES' not in messages._load_translations('kk')
+        assert msg('AUTH_CODE_EXPIRES', 'kk') == Messages.AUTH_CODE_EXPIRES
+
+    def test_unsupported_language_uses_default(self):
+        assert msg('MENU_BACK', 'de') == Messages.MENU_BACK
+
+    def test_language_code_is_normalized(self):
+        assert msg('MENU_BACK', 'RU-ru') == msg('MENU_BACK', 'ru')
+
+    def test_missing_language_uses_default(self):
+        assert msg('MENU_BACK', None) == msg('MENU_BACK', '') == Messages.MENU_BACK
+
+    def test_unknown_key(self):
+        assert msg('NO_SUCH_KEY', 'ru') == "[Missing message: NO_SUCH_KEY]"
+
+    def test_format_arguments(self):
+        assert msg('ERROR_REWARD_NOT_FOUND', 'en', reward_name='Coffee') == "Reward 'Coffee' not found."
+
+    def test_format_arguments_ignored_without_placeholders(self):
+        assert msg('MENU_BACK', 'ru', unused='x') is msg('MENU_BACK', 'ru')
+
+    def test_key_placeholder_is_a_format_argument(self):
+        text = msg('API_KEY_CREATED', 'en', name='Phone', key='hr_123')
+
+        assert '<code>hr_123</code>' in text
+        assert Messages.get('API_KEY_CREATED', 'en', name='Phone', key='hr_123') == text
+
+    def test_get_many_matches_individual_lookups(self):
+        keys = ('MENU_BACK', 'AUTH_CODE_EXPIRES', 'NO_SUCH_KEY')
+
+        assert Messages.get_many(keys, 'kk') == tuple(msg(key, 'kk') for key in keys)
+        assert Messages.get_many(keys, 'XX') == tuple(msg(key, 'en') for key in keys)
+
+
+class TestLocaleLoading:
+    """Translations are read from locales/ on first use."""
+
+    def test_language_loaded_on_first_lookup(self, monkeypatch):
+        english_only = {entry: text for entry, text in messages._FLAT_MESSAGES.items() if entry[0] == 'en'}
+        monkeypatch.setattr(messages, '_FLAT_MESSAGES', english_only)
+        monkeypatch.setattr(messages, '_loaded_languages', {'en'})
+
+        assert msg('MENU_BACK', 'kk') == messages._load_translations('kk')['MENU_BACK']
+        assert 'kk' in messages._loaded_languages
+        assert 'ru' not in messages._loaded_languages
+
+    @pytest.mark.parametrize("lang", ['ru', 'kk'])
+    def test_catalog_keys_exist_in_english(self, lang):
+        # A misspelled key (e.g. with Cyrillic letters) would silently fall back to English
+        assert set(messages._load_translations(lang)) <= set(MESSAGES_EN)
+
+    def test_language_without_catalog_uses_english(self):
+        assert messages._load_translations('xx') == {}
+
+    def test_texts_shared_by_catalogs_are_one_object(self):
+        # FORMAT_STATUS has the same Russian and Kazakh text
+        assert msg('FORMAT_STATUS', 'ru') is msg('FORMAT_STATUS', 'kk')
+
+
+class TestCompiledTemplates:
+    """_renderer() output and errors match str.format()."""
+
+    @pytest.mark.parametrize("lang", ['en', 'ru', 'kk'])
+    def test_every_template_renders_like_format(self, lang):
+        messages._load_language(lang)
+        templates = {text for (code, _), text in messages._FLAT_MESSAGES.items() if code == lang and '{' in text}
+
+        for template in templates:
+            fields = {field for _, field, _, _ in messages._FORMATTER.parse(template) if field}
+            kwargs = {field: f"<{field}>" for field in fields}
+            assert messages._renderer(template)(kwargs) == template.format(**kwargs)
+
+    @pytest.mark.parametrize("template, kwargs", [
+        ("{{literal}} {name}", {'name': 'x'}),
+        ("{name!r:>8} {count:03d}", {'name': 'x', 'count': 7}),
+        ("{0} {name}", {'name': 'x'}),
+        ("{user.name}", {'user': type('U', (), {'name': 'x'})}),
+        ("{name:{width}}", {'name': 'x', 'width': 5}),
+        ("quote ' and \"double\" \\ {name}\n", {'name': 'x'}),
+    ])
+    def test_edge_cases_match_format(self, template, kwargs):
+        try:
+            expected = template.format(**kwargs)
+        except Exception as error:  # noqa: BLE001 - compare the exception type
+            with pytest.raises(type(error)):
+                messages._renderer(template)(kwargs)
+        else:
+            assert messages._renderer(template)(kwargs) == expected
+
+    def test_missing_argument_raises_key_error(self):
+        with pytest.raises(KeyError, match='reward_name'):
+            msg('ERROR_REWARD_NOT_FOUND', 'ru', other='x')
+
+    def test_malformed_template_raises_like_format(self):
+        with pytest.raises(ValueError):
+            messages._renderer("{name")({'name': 'x'})
@@ -0,0 +1,104 @@
+"""Tests for the /start and /help user cache."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.bot import language, user_cache
+
+
+def _repo(user):
+    repo = Mock()
+    repo.get_by_telegram_id = AsyncMock(return_value=user)
+    repo.update = AsyncMock()
+    return repo
+
+
+class TestUserCache:
+    """Tests for get_user_by_telegram_id() and invalidate_user()."""
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_is_served_from_cache(self):
+        user = SimpleNamespace(id=1, language="en", is_active=True)
+        repo = _repo(user)
+
+        assert await user_cache.get_user_by_telegram_id(repo, 123) is user
+        assert await user_cache.get_user_by_telegram_id(repo, 123) is user
+
+        repo.get_by_telegram_id.assert_awaited_once_with("123")
+
+    @pytest.mark.asyncio
+    async def test_missing_user_is_cached_briefly(self):
+        repo = _repo(None)
+
+        assert await user_cache.get_user_by_telegram_id(repo, 123) is None
+        assert await user_cache.get_user_by_telegram_id(repo, 123) is None
+
+        repo.get_by_telegram_id.assert_awaited_once_with("123")
+
+    @pytest.mark.asyncio
+    async def test_expired_missing_entry_is_refetched(self):
+        user = SimpleNamespace(id=1, language="en", is_active=True)
+        repo = _repo(user)
+        user_cache._missing_users[123] = 0.0
+
+        assert await user_cache.get_user_by_telegram_id(repo, 123) is user
+        assert 123 not in user_cache._missing_users
+
+    @pytest.mark.asyncio
+    async def test_missing_cache_evicts_oldest_entry(self):
+        repo = _repo(None)
+
+        with patch.object(user_cache, "MISSING_USER_CACHE_SIZE", 2):
+            for telegram_id in (1, 2, 3):
+                await user_cache.get_user_by_telegram_id(repo, telegram_id)
+
+        assert list(user_cache._missing_users) == [2, 3]
+
+    def test_invalidate_drops_missing_entry(self):
+        user_cache._missing_users[123] = float("inf")
+
+        user_cache.invalidate_user("123")
+
+        assert 123 not in user_cache._missing_users
+
+    def test_invalidate_ignores_non_numeric_id(self):
+        user_cache.invalidate_user("not-a-telegram-id")
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self):
+        repo = _repo(SimpleNamespace(id=1, language="en", is_active=True))
+        user_cache._user_cache[123] = (SimpleNamespace(id=1, language="ru", is_active=True), 0.0)
+
+        user = await user_cache.get_user_by_telegram_id(repo, 123)
+
+        assert user.language == "en"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_dropped_when_user_is_gone(self):
+        repo = _repo(None)
+        user_cache._user_cache[123] = (SimpleNamespace(id=1, language="en", is_active=True), 0.0)
+
+        assert await user_cache.get_user_by_telegram_id(repo, 123) is None
+        assert 123 not in user_cache._user_cache
+
+    @pytest.mark.asyncio
+    async def test_user_cache_evicts_oldest_entry(self):
+        repo = _repo(SimpleNamespace(id=1, language="en", is_active=True))
+
+        with patch.object(user_cache, "USER_CACHE_SIZE", 2):
+            for telegram_id in (1, 2, 3):
+                await user_cache.get_user_by_telegram_id(repo, telegram_id)
+
+        assert list(user_cache._user_cache) == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_set_user_language_invalidates_entry(self):
+        repo = _repo(SimpleNamespace(id=1, language="en", is_active=True))
+        await user_cache.get_user_by_telegram_id(repo, 123)
+
+        with patch("src.bot.language._resolve_user_repository", return_value=repo):
+            assert await language.set_user_language("123", "ru") is True
+
+        assert 123 not in user_cache._user_cache
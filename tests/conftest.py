@@ -37,3 +37,15 @@ def pytest_collection_modifyitems(items):
         # Skip tests marked with local_only in CI environments
         if is_ci and 'local_only' in item.keywords:
             item.add_marker(skip_local_only)
+
+
+@pytest.fixture(autouse=True)
+def clear_bot_user_cache():
+    """Keep the /start and /help user cache from leaking between tests."""
+    from src.bot.user_cache import _missing_users, _user_cache
+
+    _user_cache.clear()
+    _missing_users.clear()
+    yield
+    _user_cache.clear()
+    _missing_users.clear()
@@ -6,8 +6,9 @@ from django.contrib.messages import get_messages
 from django.contrib.messages.storage.fallback import FallbackStorage
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.test import RequestFactory, TestCase
+from unittest.mock import Mock, patch
 
-from src.core.admin import HabitLogAdmin
+from src.core.admin import HabitLogAdmin, UserAdmin
 from src.core.models import User, Habit, Reward, RewardProgress, HabitLog, BotAuditLog
 
 
@@ -489,3 +490,36 @@ class TestRevertSelectedLogsAction(TestCase):
 
         # Log should still be deleted
         self.assertEqual(HabitLog.objects.filter(id=log.id).count(), 0)
+
+
+class TestUserAdminSaveModel(TestCase):
+    """Test that admin edits reach the bot's user cache."""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            telegram_id='123456789',
+            name='Test User',
+            username='test_user',
+            language='en',
+            is_active=True
+        )
+        self.admin = UserAdmin(User, AdminSite())
+        self.request = RequestFactory().post('/admin/core/user/')
+
+    @patch('src.core.admin.invalidate_user')
+    def test_deactivation_invalidates_cached_user(self, mock_invalidate):
+        self.user.is_active = False
+        form = Mock(changed_data=['is_active'])
+
+        self.admin.save_model(self.request, self.user, form, change=True)
+
+        mock_invalidate.assert_called_once_with('123456789')
+
+    @patch('src.core.admin.invalidate_user')
+    def test_other_changes_keep_cached_user(self, mock_invalidate):
+        self.user.name = 'Renamed'
+        form = Mock(changed_data=['name'])
+
+        self.admin.save_model(self.request, self.user, form, change=True)
+
+        mock_invalidate.assert_not_called()
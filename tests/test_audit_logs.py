@@ -27,7 +27,7 @@ from src.core.models import User, Habit, Reward, HabitLog, RewardProgress, BotAu
 from src.services.habit_service import habit_service
 from src.services.reward_service import reward_service
 from src.services.audit_log_service import audit_log_service
-from src.bot.main import start_command, help_command
+from src.bot.handlers.command_handlers import start_command, help_command
 from telegram import Update, Message, User as TelegramUser
 
 
@@ -6,7 +6,7 @@ from unittest.mock import Mock, AsyncMock, patch
 from telegram import Update, Message, User as TelegramUser
 from telegram.ext import ConversationHandler
 
-from src.bot.main import start_command, help_command
+from src.bot.handlers.command_handlers import start_command, help_command
 from src.bot.handlers.habit_done_handler import habit_done_command
 from src.bot.handlers.streak_handler import streaks_command
 from src.bot.handlers.reward_handlers import (
@@ -217,6 +217,37 @@ class TestStartCommand:
         assert call_args[1].get("parse_mode") == "HTML"
 
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stored, telegram_code, expected_write", [
+        ("en", "ru", "ru"),
+        (None, "kk", "kk"),
+        (None, "en", None),
+        ("ru", "kk", None),
+    ])
+    @patch('src.bot.handlers.command_handlers.default_user_repository')
+    async def test_language_written_only_when_it_changes(
+        self, mock_user_repo, stored, telegram_code, expected_write
+    ):
+        """Auto-detected language is persisted only when it differs from the stored one."""
+        update = Mock(spec=Update)
+        update.effective_user = TelegramUser(
+            id=999999999, first_name="Test", is_bot=False, language_code=telegram_code
+        )
+        update.message = Mock(spec=Message)
+        update.message.reply_text = AsyncMock()
+        mock_user_repo.get_by_telegram_id.return_value = User(
+            id=123, telegram_id="999999999", name="Test User", is_active=True, language=stored
+        )
+        mock_user_repo.update = AsyncMock()
+
+        await start_command(update, context=None)
+
+        if expected_write:
+            mock_user_repo.update.assert_awaited_once_with(123, {"language": expected_write})
+        else:
+            mock_user_repo.update.assert_not_called()
+
+
 class TestHelpCommand:
     """Test /help command handler with multi-language support."""
 
@@ -291,6 +322,82 @@ class TestHelpCommand:
         assert "/habit_done" in message_text
         assert call_args[1].get("parse_mode") == "HTML"
 
+    @pytest.mark.asyncio
+    @patch('src.bot.handlers.command_handlers.default_user_repository')
+    async def test_user_fetched_once(self, mock_user_repo, mock_telegram_update, mock_active_user):
+        """Help derives the language from the loaded user instead of fetching it again."""
+        mock_user_repo.get_by_telegram_id.return_value = mock_active_user
+
+        with patch('src.bot.language._resolve_user_repository') as mock_resolve:
+            await help_command(mock_telegram_update, context=None)
+
+        mock_user_repo.get_by_telegram_id.assert_called_once()
+        mock_resolve.assert_not_called()
+
+
+class TestHandlerRegistration:
+    """Tests for the handler table shared by polling and webhook mode."""
+
+    @staticmethod
+    def _dispatchers(groups):
+        from src.bot.handlers.command_dispatch import CommandDispatchHandler
+
+        return [handler for handler in groups[0] if isinstance(handler, CommandDispatchHandler)]
+
+    def test_webhook_commands_registered_in_one_blocking_handler(self):
+        from src.bot.handlers.registry import COMMANDS, get_handler_groups
+
+        dispatchers = self._dispatchers(get_handler_groups())
+
+        assert len(dispatchers) == 1
+        assert dispatchers[0].commands == frozenset(COMMANDS)
+        assert dispatchers[0].block  # PTB default: blocking
+
+    def test_polling_runs_only_start_and_help_without_blocking(self):
+        from src.bot import main as bot_main
+        from src.bot.handlers.registry import COMMANDS, get_handler_groups
+
+        non_blocking, blocking = self._dispatchers(get_handler_groups(bot_main.NON_BLOCKING_COMMANDS))
+
+        assert non_blocking.commands == frozenset({"start", "help"})
+        assert non_blocking.block is False
+        assert blocking.commands == frozenset(COMMANDS) - {"start", "help"}
+        assert blocking.block  # PTB default: blocking
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text, length, expected", [
+        ("/streaks", 8, "streaks"),
+        ("/My_Rewards@habit_bot extra", 21, "my_rewards"),
+    ])
+    async def test_dispatch_calls_command_callback(self, text, length, expected):
+        from src.bot.handlers.command_dispatch import CommandDispatchHandler
+
+        callbacks = {"streaks": AsyncMock(), "my_rewards": AsyncMock()}
+        handler = CommandDispatchHandler(callbacks)
+        message = Mock(text=text, entities=[Mock(length=length)])
+        update = Mock(effective_message=message)
+
+        await handler.callback(update, None)
+
+        callbacks[expected].assert_awaited_once_with(update, None)
+        for name, callback in callbacks.items():
+            if name != expected:
+                callback.assert_not_awaited()
+
+
+class TestPollingEntryPoint:
+    """Tests for the development polling entry point."""
+
+    def test_refuses_to_poll_when_webhook_configured(self):
+        from django.test import override_settings
+        from src.bot import main as bot_main
+
+        with override_settings(TELEGRAM_WEBHOOK_URL="https://example.com/webhook/telegram"), \
+                patch.object(bot_main.Application, "builder") as mock_builder:
+            bot_main.main()
+
+        mock_builder.assert_not_called()
+
 
 class TestStartMenuKeyboard:
     """Tests for the Start menu keyboard layout."""
@@ -376,6 +483,26 @@ class TestMenuHandlers:
             for handler in remove_entry_points
         )
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("data, target", [
+        ('menu_help', 'src.bot.handlers.command_handlers.help_command'),
+        ('menu_streaks', 'src.bot.handlers.streak_handler.streaks_command'),
+    ])
+    async def test_bridge_dispatches_to_command(self, mock_callback_update, data, target):
+        mock_callback_update.callback_query.data = data
+
+        with patch(target, new_callable=AsyncMock) as command, \
+                patch('src.bot.handlers.menu_handler.get_message_language_async',
+                      new=AsyncMock(return_value='en')):
+            assert await bridge_command_callback(mock_callback_update, context=None) == 0
+
+        command.assert_awaited_once()
+        synthetic_update = command.await_args.args[0]
+        assert synthetic_update.effective_user is mock_callback_update.effective_user
+
+    def test_menu_handlers_built_once(self):
+        assert get_menu_handlers() is get_menu_handlers()
+
     @pytest.mark.asyncio
     async def test_back_to_start_menu(self, mock_callback_update, language):
         mock_callback_update.callback_query.data = 'menu_back_start'